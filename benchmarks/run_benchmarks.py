@@ -0,0 +1,188 @@
+"""
+Benchmarks for the Seat Connect integration
+
+Sets up the integration, all its platforms and the account coordinator
+against the local stand-in API in stub_api.py and reports, for growing
+numbers of vehicles and enabled services:
+
+- cold start: time to set up all config entries, login included
+- refresh latency: time of a coordinator refresh with changed vehicle data
+- state writes per refresh
+- memory allocated per entity during setup
+
+Requires Home Assistant and pytest-homeassistant-custom-component, run from
+the repository root:
+
+    python benchmarks/run_benchmarks.py --vehicles 1 5 10 --refreshes 20
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import tracemalloc
+from time import perf_counter
+from unittest.mock import patch
+
+import aiohttp
+from homeassistant import loader
+from homeassistant.helpers.entity import Entity
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_test_home_assistant,
+    mock_storage,
+)
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from custom_components.seatconnect.const import COORDINATORS, DOMAIN  # noqa: E402
+from custom_components.seatconnect.storage import SeatTokenStore  # noqa: E402
+from stub_api import SERVICES, StubApi, rewrite_session, session_tokens  # noqa: E402
+
+USERNAME = "benchmark@example.com"
+
+# Enabled services per scenario, more services give more instruments per vehicle
+SERVICE_LEVELS = {
+    "minimal": ["statusreport_v1", "carfinder_v1"],
+    "full": SERVICES,
+}
+
+
+def _entry(vin):
+    """Return a config entry for a vehicle on the benchmark account."""
+    return MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        unique_id=vin,
+        title=vin,
+        data={
+            "username": USERNAME,
+            "password": "benchmark",
+            "vehicle": vin,
+            "instruments": {},
+        },
+        options={
+            "convert": "no_conversion",
+            "mutable": True,
+            "scan_interval": 120,
+            "adaptive_polling": False,
+            "debug": False,
+            "spin": None,
+        },
+    )
+
+
+async def run_scenario(vehicles, level, refreshes):
+    """Run one scenario and return its measurements."""
+    api = StubApi(vehicles, SERVICE_LEVELS[level])
+    await api.start()
+    session = rewrite_session(aiohttp.ClientSession(), api.port)
+
+    hass = await async_test_home_assistant(asyncio.get_running_loop())
+    # Load the integration from this repository
+    hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+
+    writes = 0
+    write_ha_state = Entity.async_write_ha_state
+
+    def counted_write_ha_state(self):
+        nonlocal writes
+        writes += 1
+        write_ha_state(self)
+
+    with mock_storage(), patch(
+        "custom_components.seatconnect.async_get_clientsession", return_value=session
+    ), patch.object(Entity, "async_write_ha_state", counted_write_ha_state):
+        # Start from stored tokens, the stub does not implement the interactive login
+        await SeatTokenStore(hass, USERNAME).async_save(session_tokens())
+        entries = [_entry(vin) for vin in api.vehicles]
+        for entry in entries:
+            entry.add_to_hass(hass)
+
+        tracemalloc.start()
+        memory = tracemalloc.get_traced_memory()[0]
+        started = perf_counter()
+        # Setting up the first entry sets up all entries of the domain
+        await hass.config_entries.async_setup(entries[0].entry_id)
+        await hass.async_block_till_done()
+        cold_start = perf_counter() - started
+        memory = tracemalloc.get_traced_memory()[0] - memory
+        tracemalloc.stop()
+
+        entities = [
+            state for state in hass.states.async_all()
+            if state.entity_id.split(".")[1].startswith("bench_")
+        ]
+        coordinator = hass.data[DOMAIN][COORDINATORS][USERNAME]
+
+        latencies = []
+        write_counts = []
+        requests = api.requests
+        for _ in range(refreshes):
+            api.mutate()
+            writes = 0
+            started = perf_counter()
+            await coordinator.async_refresh()
+            await hass.async_block_till_done()
+            latencies.append(perf_counter() - started)
+            write_counts.append(writes)
+        requests = (api.requests - requests) / max(1, refreshes)
+
+        for entry in entries:
+            await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+        # Stopping writes pending delayed saves, these must go to the mocked storage
+        await hass.async_stop(force=True)
+    await session.close()
+    await api.stop()
+
+    return {
+        "vehicles": vehicles,
+        "services": level,
+        "entities": len(entities),
+        "cold_start_ms": round(cold_start * 1000, 1),
+        "refresh_ms_mean": round(statistics.mean(latencies) * 1000, 2),
+        "refresh_ms_p95": round(
+            (statistics.quantiles(latencies, n=20)[-1] if len(latencies) > 1 else latencies[0]) * 1000, 2
+        ),
+        "writes_per_refresh": round(statistics.mean(write_counts), 1),
+        "requests_per_refresh": round(requests, 1),
+        "kib_per_entity": round(memory / 1024 / max(1, len(entities)), 1),
+    }
+
+
+def _print_table(results):
+    """Print results as an aligned table."""
+    columns = list(results[0])
+    widths = [max(len(column), *(len(str(result[column])) for result in results)) for column in columns]
+    print("  ".join(column.rjust(width) for column, width in zip(columns, widths)))
+    for result in results:
+        print("  ".join(str(result[column]).rjust(width) for column, width in zip(columns, widths)))
+
+
+async def main(args):
+    # Warm up, imports and caches would otherwise be accounted to the first scenario
+    await run_scenario(1, "minimal", 1)
+    results = []
+    for level in args.services:
+        for vehicles in args.vehicles:
+            results.append(await run_scenario(vehicles, level, args.refreshes))
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        _print_table(results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--vehicles", type=int, nargs="+", default=[1, 5, 10])
+    parser.add_argument("--services", nargs="+", choices=list(SERVICE_LEVELS), default=list(SERVICE_LEVELS))
+    parser.add_argument("--refreshes", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--verbose", action="store_true", help="show warnings from the integration")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING if args.verbose else logging.CRITICAL)
+    asyncio.run(main(args))
@@ -0,0 +1,318 @@
+"""
+Local stand-in for the Seat Connect API
+
+Serves the endpoints seatconnect.Connection uses once logged in, for a
+configurable set of vehicles. Requests from the library are routed here by
+rewriting the URLs of an aiohttp ClientSession, see rewrite_session().
+"""
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+import jwt
+from aiohttp import web
+from yarl import URL
+
+SUBJECT = "benchmark-user"
+
+# Services the stub reports for vehicles
+SERVICES = [
+    "statusreport_v1",
+    "carfinder_v1",
+    "trip_statistic_v1",
+    "rbatterycharge_v1",
+    "rclima_v1",
+    "timerprogramming_v1",
+    "rheating_v1",
+    "rlu_v1",
+    "rhonk_v1",
+]
+
+# Data endpoints by API name in "fs-car/bs/<api>/...", with service and StubVehicle method serving them
+SECTIONS = {
+    "vsr": ("statusreport_v1", "status"),
+    "cf": ("carfinder_v1", "position"),
+    "tripstatistics": ("trip_statistic_v1", "tripdata"),
+    "batterycharge": ("rbatterycharge_v1", "charger"),
+    "climatisation": ("rclima_v1", "climater"),
+    "departuretimer": ("timerprogramming_v1", "timer"),
+    "rs": ("rheating_v1", "heating"),
+}
+
+# Fields of the status report, value "2" reads as locked/closed where it applies
+STATUS_FIELDS = [
+    "0x0101010002", "0x0203010001", "0x0203010002", "0x0203010003", "0x0203010004",
+    "0x02040C0001", "0x0301010001", "0x0301020001", "0x0301030005", "0x0301030006",
+    "0x0301030007", "0x0301030008", "0x0301030009", "0x030103000A", "0x0301040001",
+    "0x0301040002", "0x0301040004", "0x0301040005", "0x0301040007", "0x0301040008",
+    "0x030104000A", "0x030104000B", "0x030104000D", "0x030104000E", "0x0301040011",
+    "0x0301050001", "0x0301050003", "0x0301050005", "0x0301050007", "0x030105000B",
+]
+
+
+def token(audience="benchmark", lifetime=86400):
+    """Return an unsigned looking JWT the library accepts without verification."""
+    now = int(time.time())
+    return jwt.encode(
+        {"sub": SUBJECT, "aud": audience, "iat": now, "exp": now + lifetime},
+        "benchmark",
+        algorithm="HS256",
+    )
+
+
+def session_tokens():
+    """Return tokens for all clients used by the library."""
+    return {
+        client: {"access_token": token(), "refresh_token": token(), "id_token": token()}
+        for client in ["seat", "vwg"]
+    }
+
+
+def vin_for(index):
+    """Return a VIN for vehicle number index."""
+    return f"VSSZZZKJZBENCH{index:03d}"
+
+
+class StubVehicle:
+    """State of a vehicle served by the stub."""
+
+    def __init__(self, vin, services):
+        self.vin = vin
+        self.services = services
+        self.values = {
+            "distance": 12000,
+            "battery": 60,
+            "temperature": 2930,
+            "range": 250,
+            "lat": 59329323,
+            "lng": 18068581,
+        }
+
+    def mutate(self, share=0.5):
+        """Change a share of the values, as if the car reported new data."""
+        for key in random.sample(list(self.values), max(1, int(len(self.values) * share))):
+            self.values[key] += random.choice([-1, 1])
+
+    def status(self):
+        values = dict.fromkeys(STATUS_FIELDS, "2")
+        values.update({
+            "0x0101010002": str(self.values["distance"]),
+            "0x0301020001": str(self.values["temperature"]),
+            "0x0301030006": str(self.values["range"]),
+            "0x0301030007": "3",
+            "0x030103000A": "40",
+        })
+        sent = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        return {
+            "StoredVehicleDataResponse": {
+                "vehicleData": {
+                    "data": [
+                        {
+                            "id": "0x0301FFFFFF",
+                            "field": [
+                                {"id": field, "value": value, "unit": "", "tsCarSentUtc": sent}
+                                for field, value in values.items()
+                            ],
+                        }
+                    ]
+                }
+            }
+        }
+
+    def position(self):
+        return {
+            "findCarResponse": {
+                "Position": {
+                    "carCoordinate": {
+                        "latitude": self.values["lat"],
+                        "longitude": self.values["lng"],
+                    },
+                },
+                "parkingTimeUTC": "2022-01-01T12:00:00Z",
+            }
+        }
+
+    def tripdata(self):
+        return {
+            "tripData": {
+                "averageSpeed": 50,
+                "mileage": self.values["distance"] % 500,
+                "averageFuelConsumption": 55,
+                "averageElectricEngineConsumption": 170,
+                "averageRecuperation": 10,
+                "traveltime": 30,
+                "timestamp": "2022-01-01T12:00:00Z",
+            }
+        }
+
+    def charger(self):
+        return {
+            "charger": {
+                "settings": {"maxChargeCurrent": {"content": 16}},
+                "status": {
+                    "chargingStatusData": {
+                        "chargingState": {"content": "off"},
+                        "externalPowerSupplyState": {"content": "unavailable"},
+                        "energyFlow": {"content": "off"},
+                    },
+                    "batteryStatusData": {
+                        "stateOfCharge": {"content": self.values["battery"]},
+                        "remainingChargingTime": {"content": 65535},
+                    },
+                    "plugStatusData": {
+                        "plugState": {"content": "disconnected"},
+                        "lockState": {"content": "unlocked"},
+                    },
+                },
+            }
+        }
+
+    def climater(self):
+        return {
+            "climater": {
+                "settings": {
+                    "targetTemperature": {"content": 2950},
+                    "climatisationWithoutHVpower": {"content": True},
+                    "heaterSource": {"content": "electric"},
+                },
+                "status": {
+                    "climatisationStatusData": {
+                        "climatisationState": {"content": "off"},
+                    },
+                    "windowHeatingStatusData": {
+                        "windowHeatingStateFront": {"content": "off"},
+                        "windowHeatingStateRear": {"content": "off"},
+                    },
+                },
+            }
+        }
+
+    def timer(self):
+        return {
+            "timer": {
+                "timersAndProfiles": {
+                    "timerProfileList": {"timerProfile": []},
+                    "timerList": {"timer": []},
+                    "timerBasicSetting": {"chargeMinLimit": 20},
+                },
+            }
+        }
+
+    def heating(self):
+        return {
+            "statusResponse": {
+                "climatisationStateReport": {"climatisationState": "off"},
+            }
+        }
+
+
+class StubApi:
+    """aiohttp application serving the Seat Connect endpoints for a set of vehicles."""
+
+    def __init__(self, vehicles=1, services=None):
+        services = list(SERVICES) if services is None else services
+        self.vehicles = {
+            vin_for(index): StubVehicle(vin_for(index), services)
+            for index in range(vehicles)
+        }
+        self.requests = 0
+        self.app = web.Application()
+        self.app.router.add_route("*", "/{host}/{path:.*}", self.handle)
+        self._runner = None
+        self.port = None
+
+    async def start(self):
+        """Start serving on a free local port."""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        await self._runner.cleanup()
+
+    def mutate(self, share=0.5):
+        """Change data of all vehicles."""
+        for vehicle in self.vehicles.values():
+            vehicle.mutate(share)
+
+    async def handle(self, request):
+        self.requests += 1
+        path = request.match_info["path"]
+        parts = path.split("/")
+
+        if path.endswith("check-profile"):
+            return web.json_response({})
+        if path.endswith("realCarData"):
+            return web.json_response({
+                "realCars": [
+                    {"vehicleIdentificationNumber": vin, "nickname": f"Bench {vin[-3:]}"}
+                    for vin in self.vehicles
+                ]
+            })
+        if path.endswith(f"users/{SUBJECT}/vehicles"):
+            return web.json_response({
+                "userVehicles": {"vehicle": [{"content": vin} for vin in self.vehicles]}
+            })
+
+        vehicle = next((self.vehicles[part] for part in parts if part in self.vehicles), None)
+        if vehicle is None:
+            return web.json_response({}, status=404)
+
+        if "vehicleMgmt" in parts:
+            return web.json_response({
+                "vehicleDataDetail": {
+                    "ns4:carportData": {
+                        "ns4:modelCode": "KJ",
+                        "ns4:modelName": "Benchmark",
+                        "ns4:modelYear": "2022",
+                    }
+                }
+            })
+        if path.endswith("homeRegion"):
+            return web.json_response({
+                "homeRegion": {"baseUri": {"content": "https://mal-3a.prd.eu.dp.vwg-connect.com/api"}}
+            })
+        if "operationlist" in parts:
+            expires = (datetime.now(timezone.utc) + timedelta(days=365)).strftime("%Y-%m-%dT%H:%M:%S%z")
+            return web.json_response({
+                "operationList": {
+                    "serviceInfo": [
+                        {
+                            "serviceId": service,
+                            "serviceStatus": {"status": "Enabled" if service in vehicle.services else "Disabled"},
+                            "cumulatedLicense": {"expirationDate": {"content": expires}},
+                        }
+                        for service in SERVICES
+                    ]
+                }
+            })
+
+        # Data sections, served if their service is enabled
+        if parts[:2] == ["fs-car", "bs"] and parts[2] in SECTIONS:
+            service, section = SECTIONS[parts[2]]
+            if service not in vehicle.services:
+                return web.json_response({}, status=403)
+            return web.json_response(getattr(vehicle, section)())
+
+        return web.json_response({}, status=404)
+
+
+def rewrite_session(session, port):
+    """Route all requests of an aiohttp ClientSession to the stub on port."""
+    request = session._request
+
+    def _request(method, str_or_url, **kwargs):
+        url = URL(str(str_or_url))
+        local = URL.build(
+            scheme="http",
+            host="127.0.0.1",
+            port=port,
+            path=f"/{url.host}{url.path}",
+            query=url.query,
+        )
+        return request(method, local, **kwargs)
+
+    session._request = _request
+    return session
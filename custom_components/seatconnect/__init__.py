@@ -4,12 +4,12 @@ Seat Connect integration
 
 Read more at https://github.com/farfar/homeassistant-seatconnect/
 """
-import re
 import asyncio
 import logging
 from datetime import datetime, timedelta
+from functools import lru_cache
+from time import monotonic
 from typing import Union
-import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry, SOURCE_REAUTH, SOURCE_IMPORT
 from homeassistant.const import (
@@ -19,19 +19,19 @@ from homeassistant.const import (
     CONF_SCAN_INTERVAL,
     CONF_USERNAME, EVENT_HOMEASSISTANT_STOP,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
-from homeassistant.helpers import config_validation as cv, device_registry
+from homeassistant.helpers import device_registry
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.icon import icon_for_battery_level
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from seatconnect import Connection
-from seatconnect.vehicle import Vehicle
 from seatconnect.exceptions import (
-    SeatConfigException,
     SeatAuthenticationException,
     SeatAccountLockedException,
     SeatTokenExpiredException,
@@ -39,10 +39,17 @@ from seatconnect.exceptions import (
     SeatEULAException,
     SeatThrottledException,
     SeatLoginFailedException,
-    SeatInvalidRequestException,
     SeatRequestInProgressException
 )
 
+from .scheduler import SeatPollScheduler
+from .throttle import SeatRequestBudget
+from .stats import SeatRefreshStats
+from .commands import SeatCommandQueue
+from .devices import async_get_device_index
+from .services import async_setup_services, async_unload_services
+from .storage import SeatSnapshotStore, SeatTokenStore, StoredInstrument
+from .history import TRIP_STATISTICS, SeatHistory, async_fetch_trips
 from .const import (
     PLATFORMS,
     CONF_MUTABLE,
@@ -52,71 +59,34 @@ from .const import (
     CONF_INSTRUMENTS,
     DATA,
     DATA_KEY,
+    COORDINATORS,
+    DEVICE_INDEX,
+    PENDING_CONNECTIONS,
     MIN_SCAN_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     SIGNAL_STATE_UPDATED,
     UNDO_UPDATE_LISTENER, UPDATE_CALLBACK, CONF_DEBUG, DEFAULT_DEBUG, CONF_CONVERT, CONF_NO_CONVERSION,
     CONF_IMPERIAL_UNITS,
-    SERVICE_SET_SCHEDULE,
-    SERVICE_SET_MAX_CURRENT,
-    SERVICE_SET_CHARGE_LIMIT,
-    SERVICE_SET_CLIMATER,
-    SERVICE_SET_PHEATER_DURATION,
-)
-
-SERVICE_SET_SCHEDULE_SCHEMA = vol.Schema(
-    {
-        vol.Required("device_id"): vol.All(cv.string, vol.Length(min=32, max=32)),
-        vol.Required("id"): vol.In([1,2,3]),
-        vol.Required("time"): cv.string,
-        vol.Required("enabled"): cv.boolean,
-        vol.Required("recurring"): cv.boolean,
-        vol.Optional("date"): cv.string,
-        vol.Optional("days"): cv.string,
-        vol.Optional("temp"): vol.All(vol.Coerce(int), vol.Range(min=16, max=30)),
-        vol.Optional("climatisation"): cv.boolean,
-        vol.Optional("charging"): cv.boolean,
-        vol.Optional("charge_current"): vol.Any(
-            vol.Range(min=1, max=254),
-            vol.In(['Maximum', 'maximum', 'Max', 'max', 'Minimum', 'minimum', 'Min', 'min', 'Reduced', 'reduced'])
-        ),
-        vol.Optional("charge_target"): vol.In([0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100]),
-        vol.Optional("off_peak_active"): cv.boolean,
-        vol.Optional("off_peak_start"): cv.string,
-        vol.Optional("off_peak_end"): cv.string,
-    }
-)
-SERVICE_SET_MAX_CURRENT_SCHEMA = vol.Schema(
-    {
-        vol.Required("device_id"): vol.All(cv.string, vol.Length(min=32, max=32)),
-        vol.Required("current"): vol.Any(
-            vol.Range(min=1, max=255),
-            vol.In(['Maximum', 'maximum', 'Max', 'max', 'Minimum', 'minimum', 'Min', 'min', 'Reduced', 'reduced'])
-        ),
-    }
-)
-SERVICE_SET_CHARGE_LIMIT_SCHEMA = vol.Schema(
-    {
-        vol.Required("device_id"): vol.All(cv.string, vol.Length(min=32, max=32)),
-        vol.Required("limit"): vol.In([0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100]),
-    }
-)
-SERVICE_SET_CLIMATER_SCHEMA = vol.Schema(
-    {
-        vol.Required("device_id"): vol.All(cv.string, vol.Length(min=32, max=32)),
-        vol.Required("enabled", default=True): cv.boolean,
-        vol.Optional("temp"): vol.All(vol.Coerce(int), vol.Range(min=16, max=30)),
-        vol.Optional("battery_power"): cv.boolean,
-        vol.Optional("aux_heater"): cv.boolean,
-        vol.Optional("spin"): vol.All(cv.string, vol.Match(r"^[0-9]{4}$"))
-    }
-)
-SERVICE_SET_PHEATER_DURATION_SCHEMA = vol.Schema(
-    {
-        vol.Required("device_id"): vol.All(cv.string, vol.Length(min=32, max=32)),
-        vol.Required("duration"): vol.In([10, 20, 30, 40, 50, 60]),
-    }
+    CONF_ADAPTIVE_POLLING,
+    DEFAULT_ADAPTIVE_POLLING,
+    CONF_REVOKE_TOKENS,
+    DEFAULT_REVOKE_TOKENS,
+    CONF_MAX_CONCURRENT_UPDATES,
+    DEFAULT_MAX_CONCURRENT_UPDATES,
+    CONF_REFRESH_COOLDOWN,
+    DEFAULT_REFRESH_COOLDOWN,
+    CONF_REQUEST_BUDGET,
+    DEFAULT_REQUEST_BUDGET,
+    API_CALLS_PER_VEHICLE,
+    COMMAND_SECTIONS,
+    FOLLOW_UP_DELAY,
+    FOLLOW_UP_MAX_DELAY,
+    FOLLOW_UP_TIMEOUT,
+    HISTORY_IMPORT_INTERVAL,
+    SECTIONS,
+    SECTION_ATTRS,
+    SECTIONLESS_ATTRS,
 )
 
 # Set max parallel updates to 2 simultaneous (1 poll and 1 request waiting)
@@ -128,36 +98,46 @@ _LOGGER = logging.getLogger(__name__)
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Setup Seat Connect component from a config entry."""
     hass.data.setdefault(DOMAIN, {})
-
-    if entry.options.get(CONF_SCAN_INTERVAL):
-        update_interval = timedelta(seconds=entry.options[CONF_SCAN_INTERVAL])
+    vin = entry.data[CONF_VEHICLE].upper()
+
+    # Vehicles on the same account share one coordinator, connection and polling loop
+    coordinators = hass.data[DOMAIN].setdefault(COORDINATORS, {})
+    coordinator = coordinators.get(entry.data[CONF_USERNAME].lower())
+    if coordinator is None:
+        coordinator = SeatCoordinator(hass, entry, get_update_interval(entry))
+        coordinators[coordinator.username] = coordinator
+    coordinator.async_add_entry(entry)
+    # Not needed if the account was already logged in by another entry
+    async_pop_pending_connection(hass, coordinator.username)
+    async_get_device_index(hass).async_invalidate()
+
+    if not coordinator.async_instruments(vin) and await coordinator.async_restore(vin):
+        # Serve the last known state right away, login and update in the background
+        _LOGGER.debug(f"Restored last known state of {vin}, updating from Seat Connect in background")
+        hass.async_create_task(coordinator.async_refresh())
     else:
-        update_interval = timedelta(seconds=DEFAULT_SCAN_INTERVAL)
-    if update_interval < timedelta(seconds=MIN_SCAN_INTERVAL):
-        update_interval = timedelta(seconds=MIN_SCAN_INTERVAL)
-
-    coordinator = SeatCoordinator(hass, entry, update_interval)
-
-    try:
-        if not await coordinator.async_login():
-            await hass.config_entries.flow.async_init(
-                DOMAIN,
-                context={"source": SOURCE_REAUTH},
-                data=entry,
-            )
-            return False
-    except (SeatAuthenticationException, SeatAccountLockedException, SeatLoginFailedException) as e:
-        raise ConfigEntryAuthFailed(e) from e
-    except Exception as e:
-        raise ConfigEntryNotReady(e) from e
-
-    entry.async_on_unload(
-        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, coordinator.async_logout)
-    )
+        try:
+            if not await coordinator.async_login():
+                await async_release_coordinator(hass, entry)
+                await hass.config_entries.flow.async_init(
+                    DOMAIN,
+                    context={"source": SOURCE_REAUTH},
+                    data=entry,
+                )
+                return False
+        except (SeatAuthenticationException, SeatAccountLockedException, SeatLoginFailedException, ConfigEntryAuthFailed) as e:
+            await async_release_coordinator(hass, entry)
+            raise ConfigEntryAuthFailed(e) from e
+        except Exception as e:
+            await async_release_coordinator(hass, entry)
+            raise ConfigEntryNotReady(e) from e
 
-    await coordinator.async_refresh()
-    if not coordinator.last_update_success:
-        raise ConfigEntryNotReady
+        # Only refresh if data for this vehicle isn't already fetched by another entry
+        if not coordinator.last_update_success or not coordinator.async_instruments(vin):
+            await coordinator.async_refresh()
+        if not coordinator.last_update_success or not coordinator.async_instruments(vin):
+            await async_release_coordinator(hass, entry)
+            raise ConfigEntryNotReady
 
     # Get parent device
     try:
@@ -170,7 +150,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         name = None
 
     data = SeatData(entry.data, name, coordinator)
-    instruments = coordinator.data
+    data.options = dict(entry.options)
+    instruments = coordinator.async_instruments(vin)
 
     conf_instruments = entry.data.get(CONF_INSTRUMENTS, {}).copy()
     if entry.options.get(CONF_DEBUG, False) is True:
@@ -180,12 +161,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         _LOGGER.debug(f"All instruments (data): {conf_instruments}")
     new_instruments = {}
 
-    def is_enabled(attr):
-        """Return true if the user has enabled the resource."""
-        return attr in entry.data.get(CONF_RESOURCES, [attr])
-
-    components = set()
-
     # Check if new instruments
     for instrument in (
         instrument
@@ -225,19 +200,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
             options={**entry.options, **update['options']}
         )
 
-    for instrument in (
-        instrument
-        for instrument in instruments
-        if instrument.component in PLATFORMS and is_enabled(instrument.slug_attr)
-    ):
-        data.instruments.add(instrument)
-        components.add(PLATFORMS[instrument.component])
+    data.instruments = async_enabled_instruments(entry, instruments)
+    components = {PLATFORMS[instrument.component] for instrument in data.instruments}
 
-    for component in components:
-        coordinator.platforms.append(component)
-        hass.async_create_task(
-            hass.config_entries.async_forward_entry_setups(entry, [component])
-        )
+    # Diagnostic sensors are always added
+    components.add(PLATFORMS["sensor"])
 
     hass.data[DOMAIN][entry.entry_id] = {
         UPDATE_CALLBACK: update_callback,
@@ -245,218 +212,36 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         UNDO_UPDATE_LISTENER: entry.add_update_listener(_async_update_listener),
     }
 
-    # Service functions
-    async def get_car(service_call):
-        """Get VIN associated with HomeAssistant device ID."""
-        # Get device entry
-        dev_id = service_call.data.get("device_id")
-        dev_reg = device_registry.async_get(hass)
-        dev_entry = dev_reg.async_get(dev_id)
-
-        # Get vehicle VIN from device identifiers
-        seat_identifiers = [
-            identifier
-            for identifier in dev_entry.identifiers
-            if identifier[0] == DOMAIN
-        ]
-        vin_identifier = next(iter(seat_identifiers))
-        vin = vin_identifier[1]
-
-        # Get coordinator handling the device entry
-        conf_entry = next(iter(dev_entry.config_entries))
-        try:
-            dev_coordinator = hass.data[DOMAIN][conf_entry]['data'].coordinator
-        except:
-            raise SeatConfigException('Could not find associated coordinator for given vehicle')
-
-        # Return with associated Vehicle class object
-        return dev_coordinator.connection.vehicle(vin)
-
-    async def set_schedule(service_call=None):
-        """Set departure schedule."""
-        try:
-            # Prepare data
-            id = service_call.data.get("id", 0)
-            temp = None
-
-            # Convert datetime objects to simple strings or check that strings are correctly formatted
-            try:
-                time = service_call.data.get("time").strftime("%H:%M")
-            except:
-                if re.match('^[0-9]{2}:[0-9]{2}$', service_call.data.get('time', '')):
-                    time = service_call.data.get("time", "08:00")
-                else:
-                    raise SeatInvalidRequestException(f"Invalid time string: {service_call.data.get('time')}")
-            if service_call.data.get("off_peak_start", False):
-                try:
-                    peakstart = service_call.data.get("off_peak_start").strftime("%H:%M")
-                except:
-                    if re.match('^[0-9]{2}:[0-9]{2}$', service_call.data.get("off_peak_start", "")):
-                        time = service_call.data.get("off_peak_start", "00:00")
-                    else:
-                        raise SeatInvalidRequestException(f"Invalid value for off peak start hours: {service_call.data.get('off_peak_start')}")
-            if service_call.data.get("off_peak_end", False):
-                try:
-                    peakend = service_call.data.get("off_peak_end").strftime("%H:%M")
-                except:
-                    if re.match('^[0-9]{2}:[0-9]{2}$', service_call.data.get("off_peak_end", "")):
-                        time = service_call.data.get("off_peak_end", "00:00")
-                    else:
-                        raise SeatInvalidRequestException(f"Invalid value for off peak end hours: {service_call.data.get('off_peak_end')}")
-
-            # Convert to parseable data
-            schedule = {
-                "id": service_call.data.get("id", 1),
-                "enabled": service_call.data.get("enabled"),
-                "recurring": service_call.data.get("recurring"),
-                "date": service_call.data.get("date"),
-                "time": time,
-                "days": service_call.data.get("days", "nnnnnnn"),
-            }
-            # Set optional values
-            # Night rate
-            if service_call.data.get("climatisation", None) is not None:
-                schedule["nightRateActive"] = service_call.data.get("climatisation")
-            if service_call.data.get("off_peak_start", None) is not None:
-                schedule["nightRateTimeStart"] = service_call.data.get("off_peak_start")
-            if service_call.data.get("off_peak_end", None) is not None:
-                schedule["nightRateTimeEnd"] = service_call.data.get("off_peak_end")
-            # Climatisation and charging options
-            if service_call.data.get("climatisation", None) is not None:
-                schedule["operationClimatisation"] = service_call.data.get("climatisation")
-            if service_call.data.get("charging", None) is not None:
-                schedule["operationCharging"] = service_call.data.get("charging")
-            if service_call.data.get("charge_target", None) is not None:
-                schedule["targetChargeLevel"] = service_call.data.get("charge_target")
-            if service_call.data.get("charge_current", None) is not None:
-                schedule["chargeMaxCurrent"] = service_call.data.get("charge_current")
-            # Global optional options
-            if service_call.data.get("temp", None) is not None:
-                schedule["targetTemp"] = service_call.data.get("temp")
-
-            # Find the correct car and execute service call
-            car = await get_car(service_call)
-            _LOGGER.info(f'Set departure schedule {id} with data {schedule} for car {car.vin}')
-            if await car.set_timer_schedule(id, schedule) is True:
-                _LOGGER.debug(f"Service call 'set_schedule' executed without error")
-                await coordinator.async_request_refresh()
-            else:
-                _LOGGER.warning(f"Failed to execute service call 'set_schedule' with data '{service_call}'")
-        except (SeatInvalidRequestException) as e:
-            _LOGGER.warning(f"Service call 'set_schedule' failed {e}")
-        except Exception as e:
-            raise
-
-    async def set_charge_limit(service_call=None):
-        """Set minimum charge limit."""
-        try:
-            car = await get_car(service_call)
-
-            # Get charge limit and execute service call
-            limit = service_call.data.get("limit", 50)
-            if await car.set_charge_limit(limit) is True:
-                _LOGGER.debug(f"Service call 'set_charge_limit' executed without error")
-                await coordinator.async_request_refresh()
-            else:
-                _LOGGER.warning(f"Failed to execute service call 'set_charge_limit' with data '{service_call}'")
-        except (SeatInvalidRequestException) as e:
-            _LOGGER.warning(f"Service call 'set_schedule' failed {e}")
-        except Exception as e:
-            raise
-
-    async def set_current(service_call=None):
-        """Set departure schedule."""
-        try:
-            car = await get_car(service_call)
-
-            # Get charge current and execute service call
-            current = service_call.data.get('current', None)
-            if await car.set_charger_current(current) is True:
-                _LOGGER.debug(f"Service call 'set_current' executed without error")
-                await coordinator.async_request_refresh()
-            else:
-                _LOGGER.warning(f"Failed to execute service call 'set_current' with data '{service_call}'")
-        except (SeatInvalidRequestException) as e:
-            _LOGGER.warning(f"Service call 'set_schedule' failed {e}")
-        except Exception as e:
-            raise
+    # Set up all platforms concurrently and wait for them, unload must not race a half-started setup
+    data.platforms.extend(sorted(components))
+    started = monotonic()
+    await hass.config_entries.async_forward_entry_setups(entry, data.platforms)
+    _LOGGER.debug(
+        f"Set up platforms {', '.join(data.platforms)} for {vin} in {monotonic() - started:.3f} s, "
+        + ", ".join(f"{platform}: {seconds * 1000:.1f} ms" for platform, seconds in data.setup_times.items())
+    )
 
-    async def set_pheater_duration(service_call=None):
-        """Set duration for parking heater."""
-        try:
-            car = await get_car(service_call)
-            car.pheater_duration = service_call.data.get("duration", car.pheater_duration)
-            _LOGGER.debug(f"Service call 'set_pheater_duration' executed without error")
-            await coordinator.async_request_refresh()
-        except (SeatInvalidRequestException) as e:
-            _LOGGER.warning(f"Service call 'set_schedule' failed {e}")
-        except Exception as e:
-            raise
+    async_setup_services(hass)
 
-    async def set_climater(service_call=None):
-        """Start or stop climatisation with options."""
-        try:
-            car = await get_car(service_call)
-
-            if service_call.data.get('enabled'):
-                action = 'auxiliary' if service_call.data.get('aux_heater', False) else 'electric'
-                temp = service_call.data.get('temp', None)
-                hvpower = service_call.data.get('battery_power', None)
-                spin = service_call.data.get('spin', None)
-            else:
-                action = 'off'
-                temp = hvpower = spin = None
-            # Execute service call
-            if await car.set_climatisation(action, temp, hvpower, spin) is True:
-                _LOGGER.debug(f"Service call 'set_climater' executed without error")
-                await coordinator.async_request_refresh()
-            else:
-                _LOGGER.warning(f"Failed to execute service call 'set_current' with data '{service_call}'")
-        except (SeatInvalidRequestException) as e:
-            _LOGGER.warning(f"Service call 'set_schedule' failed {e}")
-        except Exception as e:
-            raise
+    return True
 
-    # Register services
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SET_SCHEDULE,
-        set_schedule,
-        schema = SERVICE_SET_SCHEDULE_SCHEMA
-    )
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SET_MAX_CURRENT,
-        set_current,
-        schema = SERVICE_SET_MAX_CURRENT_SCHEMA
-    )
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SET_CHARGE_LIMIT,
-        set_charge_limit,
-        schema = SERVICE_SET_CHARGE_LIMIT_SCHEMA
-    )
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SET_CLIMATER,
-        set_climater,
-        schema = SERVICE_SET_CLIMATER_SCHEMA
-    )
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SET_PHEATER_DURATION,
-        set_pheater_duration,
-        schema = SERVICE_SET_PHEATER_DURATION_SCHEMA
-    )
 
-    return True
+@callback
+def async_pop_pending_connection(hass: HomeAssistant, username):
+    """Return the connection a config flow logged in to the account with, None if there is none."""
+    pending = hass.data.get(DOMAIN, {}).get(PENDING_CONNECTIONS)
+    if not pending:
+        return None
+    connection = pending.pop(username.lower(), None)
+    if not pending:
+        hass.data[DOMAIN].pop(PENDING_CONNECTIONS)
+    return connection
 
 
+@callback
 def update_callback(hass, coordinator):
-    _LOGGER.debug("CALLBACK!")
-    hass.async_create_task(
-        coordinator.async_request_refresh()
-    )
+    """Write states changed by an instrument action, the library updated the vehicle after it."""
+    coordinator.async_update_listeners()
 
 
 async def async_setup(hass: HomeAssistant, config: dict):
@@ -481,13 +266,6 @@ async def async_setup(hass: HomeAssistant, config: dict):
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Unload a config entry."""
-    _LOGGER.debug("Unloading services")
-    hass.services.async_remove(DOMAIN, SERVICE_SET_SCHEDULE)
-    hass.services.async_remove(DOMAIN, SERVICE_SET_MAX_CURRENT)
-    hass.services.async_remove(DOMAIN, SERVICE_SET_CHARGE_LIMIT)
-    hass.services.async_remove(DOMAIN, SERVICE_SET_CLIMATER)
-    hass.services.async_remove(DOMAIN, SERVICE_SET_PHEATER_DURATION)
-
     _LOGGER.debug("Unloading update listener")
     hass.data[DOMAIN][entry.entry_id][UNDO_UPDATE_LISTENER]()
 
@@ -497,22 +275,14 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
 async def async_unload_coordinator(hass: HomeAssistant, entry: ConfigEntry):
     """Unload auth token based entry."""
     _LOGGER.debug("Unloading coordinator")
-    coordinator = hass.data[DOMAIN][entry.entry_id][DATA].coordinator
+    data = hass.data[DOMAIN][entry.entry_id][DATA]
 
-    _LOGGER.debug("Log out from Seat Connect")
-    await coordinator.async_logout()
-    unloaded = all(
-        await asyncio.gather(
-            *[
-                hass.config_entries.async_forward_entry_unload(entry, platform)
-                for platform in PLATFORMS
-                if platform in coordinator.platforms
-            ]
-        )
-    )
+    unloaded = await hass.config_entries.async_unload_platforms(entry, data.platforms)
     if unloaded:
         _LOGGER.debug("Unloading entry")
         del hass.data[DOMAIN][entry.entry_id]
+        await async_release_coordinator(hass, entry)
+        async_unload_services(hass)
 
     if not hass.data[DOMAIN]:
         _LOGGER.debug("Unloading data")
@@ -521,9 +291,148 @@ async def async_unload_coordinator(hass: HomeAssistant, entry: ConfigEntry):
     return unloaded
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry):
+    """Remove stored state when a config entry is removed."""
+    await SeatSnapshotStore(hass, entry).async_remove()
+    await SeatHistory(hass, entry).async_remove()
+
+    # Tokens are shared by all vehicles on the account
+    username = entry.data[CONF_USERNAME].lower()
+    if not any(
+        other.data.get(CONF_USERNAME, "").lower() == username
+        for other in hass.config_entries.async_entries(DOMAIN)
+        if other.entry_id != entry.entry_id
+    ):
+        await SeatTokenStore(hass, username).async_remove()
+
+
+async def async_release_coordinator(hass: HomeAssistant, entry: ConfigEntry):
+    """Detach entry from the account coordinator, log out when no vehicles are left."""
+    coordinators = hass.data[DOMAIN].get(COORDINATORS, {})
+    coordinator = coordinators.get(entry.data[CONF_USERNAME].lower())
+    if coordinator is None:
+        return
+    if not coordinator.async_remove_entry(entry):
+        async_get_device_index(hass).async_invalidate()
+        return
+
+    _LOGGER.debug("Log out from Seat Connect")
+    coordinators.pop(coordinator.username)
+    if not coordinators:
+        hass.data[DOMAIN].pop(COORDINATORS)
+        index = hass.data[DOMAIN].pop(DEVICE_INDEX, None)
+        if index is not None:
+            index.async_shutdown()
+    else:
+        async_get_device_index(hass).async_invalidate()
+    await coordinator.async_logout()
+
+
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry):
-    """Handle options update."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Apply changed options to the running entry, the connection is kept."""
+    data = hass.data[DOMAIN][entry.entry_id][DATA]
+    if entry.data.get(CONF_PASSWORD) != data.config.get(CONF_PASSWORD):
+        # Credentials changed, set up anew
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    previous, data.options = data.options, dict(entry.options)
+    coordinator = data.coordinator
+
+    def changed(*keys):
+        return any(previous.get(key) != entry.options.get(key) for key in keys)
+
+    if changed(CONF_SCAN_INTERVAL, CONF_ADAPTIVE_POLLING, CONF_DEBUG, CONF_REFRESH_COOLDOWN, CONF_REQUEST_BUDGET):
+        _LOGGER.debug(f"Applying poll options of {entry.title}")
+        coordinator.async_update_options()
+    if changed(CONF_CONVERT, CONF_MUTABLE, CONF_SPIN):
+        _LOGGER.debug(f"Rebuilding instruments of {entry.title}")
+        coordinator.async_rebuild_instruments()
+    await async_update_entities(hass, entry)
+
+
+async def async_update_entities(hass: HomeAssistant, entry: ConfigEntry):
+    """Add and remove entities of an entry to match its enabled resources."""
+    data = hass.data[DOMAIN][entry.entry_id][DATA]
+    if data.coordinator.data is None:
+        return
+    data.instruments = async_enabled_instruments(
+        entry, data.coordinator.async_instruments(entry.data[CONF_VEHICLE])
+    )
+    resources = get_resources(entry)
+    wanted = {
+        (instrument.component, instrument.attr)
+        for instrument in data.instruments
+        if instrument.attr in resources
+    }
+
+    for key in [key for key in data.entities if key not in wanted]:
+        _LOGGER.debug(f"Removing {key[0]} {key[1]} of {entry.title}")
+        await data.entities.pop(key).async_remove()
+
+    added = {component for component, attr in wanted if (component, attr) not in data.entities}
+    for component in added & set(data.platform_entities):
+        async_add_platform_entities(hass, entry, *data.platform_entities[component])
+    # Components without entities so far need their platform set up
+    platforms = sorted(PLATFORMS[component] for component in added if PLATFORMS[component] not in data.platforms)
+    if platforms:
+        data.platforms.extend(platforms)
+        await hass.config_entries.async_forward_entry_setups(entry, platforms)
+
+
+def get_update_interval(entry: ConfigEntry):
+    """Return the configured poll interval for entry."""
+    if entry.options.get(CONF_SCAN_INTERVAL):
+        update_interval = timedelta(seconds=entry.options[CONF_SCAN_INTERVAL])
+    else:
+        update_interval = timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+    if update_interval < timedelta(seconds=MIN_SCAN_INTERVAL):
+        update_interval = timedelta(seconds=MIN_SCAN_INTERVAL)
+    return update_interval
+
+
+def get_resources(entry: ConfigEntry):
+    """Return the resources enabled for entry."""
+    if CONF_RESOURCES in entry.options:
+        return entry.options[CONF_RESOURCES]
+    return entry.data[CONF_RESOURCES]
+
+
+@callback
+def async_enabled_instruments(entry: ConfigEntry, instruments):
+    """Return instruments of supported components enabled in the entry data."""
+    return {
+        instrument
+        for instrument in instruments
+        if instrument.component in PLATFORMS
+        and instrument.slug_attr in entry.data.get(CONF_RESOURCES, [instrument.slug_attr])
+    }
+
+
+@callback
+def async_add_platform_entities(hass, entry, async_add_entities, component, entity_class, update_callback=None):
+    """Add entities for enabled instruments of a component in one batch, skipping those already added."""
+    started = monotonic()
+    data = hass.data[DOMAIN][entry.entry_id][DATA]
+    # Kept to add entities when resources are enabled later
+    data.platform_entities[component] = (async_add_entities, component, entity_class, update_callback)
+    if data.coordinator.data is None:
+        return []
+
+    resources = get_resources(entry)
+    entities = [
+        entity_class(data, instrument.vehicle_name, instrument.component, instrument.attr, update_callback)
+        for instrument in data.instruments
+        if instrument.component == component
+        and instrument.attr in resources
+        and (component, instrument.attr) not in data.entities
+    ]
+    for entity in entities:
+        data.entities[(entity.component, entity.attribute)] = entity
+    async_add_entities(entities)
+    # Entities added later, when resources are enabled, count towards their platform
+    data.setup_times[component] = data.setup_times.get(component, 0) + monotonic() - started
+    return entities
 
 
 def get_convert_conf(entry: ConfigEntry):
@@ -535,6 +444,24 @@ def get_convert_conf(entry: ConfigEntry):
         )
     ) else CONF_NO_CONVERSION
 
+
+@lru_cache(maxsize=8)
+def parse_deadbands(value: str):
+    """Parse "attr=value" and "attr=value%" items into {attr: (value, relative)}, raise ValueError if invalid."""
+    deadbands = {}
+    for item in (value or "").replace(";", ",").split(","):
+        if not item.strip():
+            continue
+        attr, _, deadband = item.partition("=")
+        deadband = deadband.strip()
+        relative = deadband.endswith("%")
+        deadband = float(deadband.rstrip("%"))
+        if not attr.strip() or deadband < 0:
+            raise ValueError(f"Invalid deadband {item.strip()}")
+        deadbands[attr.strip()] = (deadband, relative)
+    return deadbands
+
+
 async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Migrate configuration from old version to new."""
     _LOGGER.debug(f'Migrating from version {entry.version}')
@@ -565,26 +492,41 @@ class SeatData:
         """Initialize the component state."""
         self.vehicles = set()
         self.instruments = set()
+        self.platforms = []
+        self.setup_times = {}
+        self.options = {}
+        self.entities = {}
+        self.platform_entities = {}
         self.config = config.get(DOMAIN, config)
         self.name = name
         self.coordinator = coordinator
+        self._index = {}
+        self._indexed = None
+        self._indexed_size = 0
+
+    @property
+    def _source(self):
+        """Return the current collection of instruments."""
+        if self.coordinator is not None:
+            return self.coordinator.data
+        return self.instruments
+
+    def _rebuild_index(self, source):
+        """Index instruments by (vin, component, attr)."""
+        self._index = {
+            (instrument.vehicle.vin, instrument.component, instrument.attr): instrument
+            for instrument in (source or [])
+        }
+        self._indexed = source
+        self._indexed_size = len(self._index)
 
     def instrument(self, vin, component, attr):
         """Return corresponding instrument."""
-        return next(
-            (
-                instrument
-                for instrument in (
-                    self.coordinator.data
-                    if self.coordinator is not None
-                    else self.instruments
-                )
-                if instrument.vehicle.vin == vin
-                and instrument.component == component
-                and instrument.attr == attr
-            ),
-            None,
-        )
+        source = self._source
+        # The coordinator hands out a new list on every refresh, rebuild once per list
+        if source is not self._indexed or len(source or []) != self._indexed_size:
+            self._rebuild_index(source)
+        return self._index.get((vin, component, attr))
 
     def vehicle_name(self, vehicle):
         """Provide a friendly name for a vehicle."""
@@ -624,6 +566,8 @@ class SeatEntity(Entity):
         self.coordinator = data.coordinator
         self.instrument.callback = update_callbacks
         self.callback = callback
+        self._memo = {}
+        self._memo_key = None
 
     async def async_update(self) -> None:
         """Update the entity.
@@ -641,7 +585,9 @@ class SeatEntity(Entity):
         """Register update dispatcher."""
         if self.coordinator is not None:
             self.async_on_remove(
-                self.coordinator.async_add_listener(self.async_write_ha_state)
+                self.coordinator.async_add_instrument_listener(
+                    (self.vin, self.component, self.attribute), self._async_instrument_changed
+                )
             )
         else:
             self.async_on_remove(
@@ -650,14 +596,41 @@ class SeatEntity(Entity):
                 )
             )
 
+    @callback
+    def _async_instrument_changed(self):
+        """Write the state when the instrument changed or availability of the coordinator changed."""
+        self.async_write_ha_state()
+
+    async def async_command(self, key, action, *args, done=None):
+        """Run an instrument action, queued with other requests to the vehicle."""
+        if self.coordinator is None:
+            return await action(*args)
+        return await self.coordinator.async_command(self.vin, key, action, *args, done=done)
+
     @property
     def instrument(self):
         """Return corresponding instrument."""
         return self.data.instrument(self.vin, self.component, self.attribute)
 
+    def _memoized(self, name, compute):
+        """Return a value derived from the instrument, computed once until the instrument changes."""
+        instrument = self.instrument
+        if self.coordinator is None:
+            return compute()
+        key = (instrument, self.coordinator.async_generation((self.vin, self.component, self.attribute)))
+        if key != self._memo_key:
+            self._memo = {}
+            self._memo_key = key
+        if name not in self._memo:
+            self._memo[name] = compute()
+        return self._memo[name]
+
     @property
     def icon(self):
         """Return the icon."""
+        return self._memoized("icon", self._icon)
+
+    def _icon(self):
         if self.instrument.attr in ["battery_level", "charging"]:
             return icon_for_battery_level(
                 battery_level=self.instrument.state, charging=self.vehicle.charging
@@ -680,6 +653,7 @@ class SeatEntity(Entity):
     @property
     def name(self):
         """Return full name of the entity."""
+        # Not memoized, the vehicle name (nickname) changes independently of the instrument
         return f"{self._vehicle_name} {self._entity_name}"
 
     @property
@@ -695,6 +669,9 @@ class SeatEntity(Entity):
     @property
     def extra_state_attributes(self):
         """Return extra state attributes."""
+        return self._memoized("extra_state_attributes", self._extra_state_attributes)
+
+    def _extra_state_attributes(self):
         attributes = dict(
             self.instrument.attributes,
             model=f"{self.vehicle.model}/{self.vehicle.model_year}",
@@ -724,6 +701,9 @@ class SeatEntity(Entity):
     @property
     def available(self):
         """Return if sensor is available."""
+        if isinstance(self.instrument, StoredInstrument):
+            # Last known state is served until an update of the vehicle succeeds
+            return True
         if self.data.coordinator is not None:
             return self.data.coordinator.last_update_success
         return True
@@ -734,92 +714,821 @@ class SeatEntity(Entity):
         return f"{self.vin}-{self.component}-{self.attribute}"
 
 
+def _instrument_snapshot(instrument):
+    """Return the values an entity renders from an instrument."""
+    try:
+        values = [instrument.state, instrument.attributes, getattr(instrument, "unit", None)]
+        if instrument.component == "climate":
+            values.extend([instrument.hvac_mode, instrument.target_temperature])
+        if instrument.attr in ["battery_level", "charging"]:
+            values.append(instrument.vehicle.charging)
+    except Exception as error:
+        _LOGGER.debug(f"Could not read state of {instrument.attr}: {error}")
+        return None
+    if isinstance(values[1], dict):
+        values[1] = dict(values[1])
+    return tuple(values)
+
+
 class SeatCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching data from the API."""
+    """Class to manage fetching data for all vehicles of an account from the API."""
 
     def __init__(self, hass: HomeAssistant, entry, update_interval: timedelta):
-        self.vin = entry.data[CONF_VEHICLE].upper()
-        self.entry = entry
-        self.platforms = []
+        self.username = entry.data[CONF_USERNAME].lower()
+        self.entries = {}
         self.report_last_updated = None
-        self.connection = Connection(
-            session=async_get_clientsession(hass),
-            username=self.entry.data[CONF_USERNAME],
-            password=self.entry.data[CONF_PASSWORD],
-            fulldebug=self.entry.options.get(CONF_DEBUG, self.entry.data.get(CONF_DEBUG, DEFAULT_DEBUG)),
+        self._snapshot = {}
+        self._generations = {}
+        self._instrument_listeners = {}
+        self._notified_success = None
+        self._logged_in = False
+        self._handed_over = False
+        self._login_lock = asyncio.Lock()
+        self._unsub_stop = None
+        self._base_interval = update_interval
+        self.scheduler = SeatPollScheduler()
+        self.budget = SeatRequestBudget()
+        self.stats = SeatRefreshStats()
+        self.commands = {}
+        self._follow_ups = {}
+        self._vehicle_updates = {}
+        self._fetched = {}
+        self._refreshing = False
+        self._scheduled = False
+        self._api_calls = 0
+        self._api_calls_last = None
+        self._throttled = False
+        self._dashboards = {}
+        self._dashboards_in_data = []
+        self._stores = {}
+        self.history = {}
+        self.failed_vehicles = []
+        self.refresh_requests = 0
+        self.requested_refreshes = 0
+        self._history_imported = None
+        self._history_task = None
+        self._token_store = SeatTokenStore(hass, self.username)
+        self.connection = self._create_connection(hass, entry)
+
+        # Requested refreshes run at the end of the window, requests meanwhile are coalesced into it
+        self._refresh_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=entry.options.get(CONF_REFRESH_COOLDOWN, DEFAULT_REFRESH_COOLDOWN),
+            immediate=False,
+        )
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=update_interval,
+            request_refresh_debouncer=self._refresh_debouncer,
+        )
+        self._refresh_debouncer.function = self._async_requested_refresh
+
+    def _create_connection(self, hass: HomeAssistant, entry):
+        """Create a connection with the credentials of entry, or take over the one of the config flow."""
+        fulldebug = entry.options.get(CONF_DEBUG, entry.data.get(CONF_DEBUG, DEFAULT_DEBUG))
+        connection = async_pop_pending_connection(hass, self.username)
+        if (
+            connection is not None
+            and connection._session_auth_password == entry.data[CONF_PASSWORD]
+            and connection._session_tokens
+        ):
+            _LOGGER.debug("Reusing the Seat Connect session of the config flow")
+            connection._session_fulldebug = fulldebug
+            self._handed_over = True
+        else:
+            connection = Connection(
+                session=async_get_clientsession(hass),
+                username=entry.data[CONF_USERNAME],
+                password=entry.data[CONF_PASSWORD],
+                fulldebug=fulldebug,
+            )
+
+        # The library swallows HTTP errors on data fetches, count calls and catch throttling here
+        get = connection.get
+
+        async def tracked_get(url, vin=""):
+            self._api_calls += 1
+            response = await get(url, vin)
+            if isinstance(response, dict) and response.get("status_code") == 429:
+                self._throttled = True
+            return response
+
+        connection.get = tracked_get
+
+        # Tokens are refreshed on demand during updates, time spent is part of the refresh statistics
+        refresh_token = connection.refresh_token
+
+        async def timed_refresh_token(client):
+            with self.stats.timed("token_refresh"):
+                return await refresh_token(client)
+
+        connection.refresh_token = timed_refresh_token
+        return connection
+
+    @callback
+    def async_add_entry(self, entry):
+        """Add the vehicle of a config entry to the account polling."""
+        if self.connection is not None and self.entries and (
+            entry.data[CONF_PASSWORD] != next(iter(self.entries.values())).data[CONF_PASSWORD]
+        ):
+            # Credentials changed (re-authentication), a new login is required
+            _LOGGER.debug("Credentials changed, creating new connection to Seat Connect")
+            self.connection = self._create_connection(self.hass, entry)
+            self._logged_in = False
+        elif self.connection is None:
+            self.connection = self._create_connection(self.hass, entry)
+        self.entries[entry.data[CONF_VEHICLE].upper()] = entry
+        self._stores[entry.data[CONF_VEHICLE].upper()] = SeatSnapshotStore(self.hass, entry)
+        self.history[entry.data[CONF_VEHICLE].upper()] = SeatHistory(self.hass, entry)
+        self._async_update_interval()
+
+    @callback
+    def async_remove_entry(self, entry):
+        """Remove the vehicle of a config entry, return true if no vehicles remain."""
+        self.entries.pop(entry.data[CONF_VEHICLE].upper(), None)
+        self._dashboards.pop(entry.data[CONF_VEHICLE].upper(), None)
+        self._stores.pop(entry.data[CONF_VEHICLE].upper(), None)
+        self._fetched.pop(entry.data[CONF_VEHICLE].upper(), None)
+        self.history.pop(entry.data[CONF_VEHICLE].upper(), None)
+        queue = self.commands.pop(entry.data[CONF_VEHICLE].upper(), None)
+        if queue is not None:
+            queue.async_shutdown()
+        for key in [key for key in self._follow_ups if key[0] == entry.data[CONF_VEHICLE].upper()]:
+            self._follow_ups.pop(key).cancel()
+        if not self.entries:
+            return True
+        # Make sure reauth and polling preferences follow an entry still in use
+        if self.config_entry is entry:
+            self.config_entry = next(iter(self.entries.values()))
+        self._async_update_interval()
+        return False
+
+    @callback
+    def _async_update_interval(self):
+        """Poll as often as the most demanding entry on the account requires."""
+        self._base_interval = min(
+            get_update_interval(entry) for entry in self.entries.values()
+        )
+        self.update_interval = self._base_interval
+        self._refresh_debouncer.cooldown = min(
+            entry.options.get(CONF_REFRESH_COOLDOWN, DEFAULT_REFRESH_COOLDOWN)
+            for entry in self.entries.values()
+        )
+        self.budget.configure(self.request_budget)
+
+    @callback
+    def async_update_options(self):
+        """Apply changed poll interval and debug options of the entries."""
+        self._async_update_interval()
+        if self.connection is not None:
+            self.connection._session_fulldebug = any(
+                entry.options.get(CONF_DEBUG, entry.data.get(CONF_DEBUG, DEFAULT_DEBUG))
+                for entry in self.entries.values()
+            )
+        if self._listeners:
+            self._schedule_refresh()
+
+    @callback
+    def async_rebuild_instruments(self):
+        """Rebuild instruments after dashboard options changed, from the vehicles already fetched."""
+        vehicles = [self._dashboards[vin][0] for vin in self.entries if vin in self._dashboards]
+        if len(vehicles) != len(self.entries) or self.data is None:
+            # Nothing fetched yet, the next update creates dashboards with the new options
+            return
+        self.async_set_updated_data(self._async_instruments(vehicles))
+
+    @property
+    def adaptive(self):
+        """Return true if poll interval should follow vehicle state."""
+        return all(
+            entry.options.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING)
+            for entry in self.entries.values()
+        )
+
+    @property
+    def max_concurrent_updates(self):
+        """Return how many vehicles are updated at the same time, the lowest limit of the entries."""
+        return max(1, min(
+            entry.options.get(CONF_MAX_CONCURRENT_UPDATES, DEFAULT_MAX_CONCURRENT_UPDATES)
+            for entry in self.entries.values()
+        ))
+
+    @property
+    def request_budget(self):
+        """Return the daily API request budget of the account, the lowest budget of the entries."""
+        return max(1, min(
+            entry.options.get(CONF_REQUEST_BUDGET, DEFAULT_REQUEST_BUDGET)
+            for entry in self.entries.values()
+        ))
+
+    @property
+    def revoke_tokens(self):
+        """Return true if tokens should be revoked when Home Assistant stops."""
+        return any(
+            entry.options.get(CONF_REVOKE_TOKENS, DEFAULT_REVOKE_TOKENS)
+            for entry in self.entries.values()
         )
 
-        super().__init__(hass, _LOGGER, name=DOMAIN, update_interval=update_interval)
+    @callback
+    def async_boost(self):
+        """Return to fast polling, rescheduling a pending relaxed poll."""
+        self.scheduler.boost()
+        if self.update_interval != self._base_interval:
+            self.update_interval = self._base_interval
+            if self._listeners:
+                self._schedule_refresh()
+
+    async def async_request_refresh(self):
+        """Request a refresh and poll fast for a while, state is expected to change."""
+        self.refresh_requests += 1
+        self.async_boost()
+        await super().async_request_refresh()
+
+    async def _async_requested_refresh(self):
+        """Refresh for the requests coalesced by the debouncer."""
+        self.requested_refreshes += 1
+        await self.async_refresh()
+
+    @property
+    def coalesced_requests(self):
+        """Return the number of refresh requests served by a refresh requested earlier."""
+        return max(0, self.refresh_requests - self.requested_refreshes)
+
+    async def async_command(self, vin, key, action, *args, done=None):
+        """Run a request to a vehicle through its command queue, key identifies the setting changed.
+
+        The data changed by the request is polled until done() returns true.
+        """
+        queue = self.commands.get(vin.upper())
+        if queue is None:
+            queue = self.commands[vin.upper()] = SeatCommandQueue(self.hass, vin, self._async_command_completed)
+        self._async_track_updates(vin)
+        return await queue.async_submit(key, action, *args, done=done)
+
+    @callback
+    def _async_track_updates(self, vin):
+        """Record when the library updates a vehicle, instruments do after their requests."""
+        vehicle = self.connection.vehicle(vin) if self.connection is not None else None
+        if vehicle is None or getattr(vehicle.update, "tracked", False):
+            return
+        update = vehicle.update
+
+        async def tracked_update():
+            self._vehicle_updates[vin.upper()] = monotonic()
+            return await update()
+
+        tracked_update.tracked = True
+        vehicle.update = tracked_update
+
+    @callback
+    def _async_command_completed(self, vin, command, result):
+        """Follow up on a request once, with done() of the request that replaced the others."""
+        if result is False:
+            return
+        if self._vehicle_updates.get(vin.upper(), 0) >= command.started:
+            # The library fetched all vehicle data after the request, polling again adds nothing
+            _LOGGER.debug(f"Vehicle {vin} was updated after request {command.key}, no follow-up")
+            self.async_boost()
+            if not self._refreshing:
+                self.async_update_listeners()
+            return
+        self.async_follow_up(vin, command.key, command.done)
+
+    @callback
+    def async_follow_up(self, vin, key, done=None):
+        """Poll the data section changed by a request for a while, return true if started."""
+        self.async_boost()
+        section = COMMAND_SECTIONS.get(key)
+        if section is None or self.connection is None:
+            return False
+        task = self._follow_ups.pop((vin.upper(), section), None)
+        if task is not None:
+            task.cancel()
+        self._follow_ups[(vin.upper(), section)] = self.hass.async_create_task(
+            self._async_follow_up(vin, section, done)
+        )
+        return True
+
+    async def _async_follow_up(self, vin, section, done):
+        """Poll a section with increasing delay until done(), a change if done is None, or the timeout."""
+        vehicle = self.connection.vehicle(vin)
+        if vehicle is None:
+            _LOGGER.debug(f"Vehicle {vin} is not on the Seat Connect account, no follow-up of {section}")
+            if self._follow_ups.get((vin.upper(), section)) is asyncio.current_task():
+                self._follow_ups.pop((vin.upper(), section))
+            return
+        fetch = getattr(vehicle, SECTIONS[section])
+        # The library updated the vehicle after the request, write what changed before comparing
+        if not self._refreshing:
+            self.async_update_listeners()
+        before = self._async_vehicle_snapshot(vin)
+        deadline = monotonic() + FOLLOW_UP_TIMEOUT
+        delay = FOLLOW_UP_DELAY
+        try:
+            while monotonic() + delay < deadline:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, FOLLOW_UP_MAX_DELAY)
+                if self.budget.backoff or not self.budget.can_afford(1):
+                    _LOGGER.debug(f"Stopping follow-up of {section} for {vin}, request budget exhausted")
+                    return
+                # A refresh running meanwhile fetches the section as well
+                if not self._refreshing:
+                    calls = self._api_calls
+                    try:
+                        await fetch()
+                    except Exception as error:
+                        _LOGGER.debug(f"Follow-up of {section} for {vin} failed: {error}")
+                    self.budget.consume(max(0, self._api_calls - calls))
+                    self.async_update_listeners()
+                if done() if done is not None else self._async_vehicle_snapshot(vin) != before:
+                    _LOGGER.debug(f"Request for {section} of {vin} reflected in vehicle data")
+                    return
+            _LOGGER.debug(f"Follow-up of {section} for {vin} timed out, back to regular polling")
+        finally:
+            if self._follow_ups.get((vin.upper(), section)) is asyncio.current_task():
+                self._follow_ups.pop((vin.upper(), section))
+
+    def _history_due(self, vehicles):
+        """Return true if trips should be imported into statistics now."""
+        if "recorder" not in self.hass.config.components:
+            return False
+        if self._history_task is not None and not self._history_task.done():
+            return False
+        if self._history_imported is not None and monotonic() - self._history_imported < HISTORY_IMPORT_INTERVAL:
+            return False
+        return not self._throttled and not self.budget.backoff and self.budget.can_afford(len(vehicles))
+
+    async def _async_import_history(self, vehicles):
+        """Import trips made since the last import into long-term statistics."""
+        self._history_imported = monotonic()
+        for vehicle in vehicles:
+            history = self.history.get(vehicle.vin.upper())
+            if history is None or not vehicle._services.get("trip_statistic_v1", {}).get("active", False):
+                continue
+            if self.connection is None or self.budget.backoff:
+                return
+            if self._refreshing:
+                # Calls are counted per refresh, continue after it
+                self._history_imported = None
+                return
+            calls = self._api_calls
+            try:
+                trips = await async_fetch_trips(self.connection, vehicle)
+                await history.async_import("trips", TRIP_STATISTICS, trips)
+            except SeatThrottledException:
+                # Back off like a throttled update, the next refresh is deferred
+                self.budget.throttled()
+                return
+            except Exception as error:
+                _LOGGER.warning(f"Could not import trip history of {vehicle.vin}: {error}")
+            finally:
+                self.budget.consume(max(0, self._api_calls - calls))
+
+    @callback
+    def _async_vehicle_snapshot(self, vin):
+        """Return the latest instrument values of a vehicle."""
+        return {
+            key: values
+            for key, values in self._snapshot.items()
+            if key[0].upper() == vin.upper()
+        }
+
+    @callback
+    def async_instruments(self, vin):
+        """Return instruments for a single vehicle."""
+        return [
+            instrument
+            for instrument in (self.data or [])
+            if instrument.vehicle.vin.upper() == vin.upper()
+        ]
+
+    @callback
+    def async_vehicle(self, vin):
+        """Return vehicle, or its last known information until it is updated."""
+        instruments = self.async_instruments(vin)
+        return instruments[0].vehicle if instruments else None
+
+    async def async_restore(self, vin):
+        """Serve the last known state of a vehicle until it is updated, return true if restored."""
+        instruments = await self._stores[vin.upper()].async_load()
+        if not instruments:
+            return False
+        self.data = [
+            instrument
+            for instrument in (self.data or [])
+            if instrument.vehicle.vin.upper() != vin.upper()
+        ] + instruments
+        return True
+
+    async def _handle_refresh_interval(self, _now=None):
+        """Handle a scheduled refresh, these may be deferred to stay within budget."""
+        self._scheduled = True
+        try:
+            await super()._handle_refresh_interval(_now)
+        finally:
+            self._scheduled = False
+
+    @callback
+    def _async_defer(self, seconds):
+        """Skip this update and keep serving the last data."""
+        self.budget.deferred += 1
+        self.stats.discard()
+        self.update_interval = max(self._base_interval, timedelta(seconds=seconds))
+        _LOGGER.debug(f"Deferring update from Seat Connect for {self.update_interval}")
+        return self.data
+
+    @property
+    def api_calls_estimate(self):
+        """Return the expected number of API calls for one update."""
+        if self._api_calls_last:
+            return self._api_calls_last
+        return API_CALLS_PER_VEHICLE * len(self.entries)
 
     async def _async_update_data(self):
         """Update data via library."""
-        vehicle = await self.update()
+        self._refreshing = True
+        try:
+            return await self._async_update_vehicles()
+        finally:
+            self._refreshing = False
+
+    async def _async_update_vehicles(self):
+        """Update vehicles of the account and return their instruments."""
+        self.stats.start()
+        if not self._logged_in:
+            # Login is deferred to the first update when starting from stored state
+            try:
+                with self.stats.timed("login"):
+                    logged_in = await self.async_login()
+                if not logged_in:
+                    raise ConfigEntryAuthFailed("Could not login to Seat Connect")
+            except ConfigEntryAuthFailed:
+                raise
+            except Exception as error:
+                raise UpdateFailed(f"Could not login to Seat Connect: {error}") from error
+
+        if self.data is not None:
+            if self.budget.backoff:
+                return self._async_defer(self.budget.backoff)
+            if self._scheduled and not self.budget.can_afford(self.api_calls_estimate):
+                return self._async_defer(self.budget.time_until(self.api_calls_estimate))
 
-        if not vehicle:
+        try:
+            vehicles = await self.update()
+        except SeatThrottledException as error:
+            delay = self.budget.throttled()
+            if self.data is not None:
+                return self._async_defer(delay)
+            raise UpdateFailed(f"Throttled by Seat Connect: {error}") from error
+        self.budget.succeeded()
+        # Back to the regular interval once an update goes through after being deferred
+        self.update_interval = self._base_interval
+
+        if not vehicles:
             raise UpdateFailed("No vehicles found.")
 
+        with self.stats.timed("dashboard"):
+            instruments = self._async_instruments(vehicles)
+
+        if self._history_due(vehicles):
+            # Imported after the refresh, its requests are not part of the refresh latency
+            self._history_task = self.hass.async_create_task(self._async_import_history(vehicles))
+
+        if self.adaptive:
+            self.update_interval = self.scheduler.next_interval(vehicles, self._base_interval)
+            _LOGGER.debug(f"Next poll of Seat Connect in {self.update_interval}")
+        return instruments
+
+    @callback
+    def _async_instruments(self, vehicles):
+        """Return instruments of the updated vehicles, and the last instruments of the other vehicles."""
+        dashboards = [self._async_dashboard(vehicle) for vehicle in vehicles]
+        if self.data is None or dashboards != self._dashboards_in_data:
+            # Vehicles or options changed, collect instruments anew
+            self._dashboards_in_data = dashboards
+            updated = [vehicle.vin.upper() for vehicle in vehicles]
+            instruments = [
+                instrument
+                for dashboard in dashboards
+                for instrument in dashboard.instruments
+            ] + [
+                # Failed or added during the update before it had a dashboard, keep serving its snapshot
+                instrument
+                for instrument in (self.data or [])
+                if instrument.vehicle.vin.upper() in self.entries
+                and instrument.vehicle.vin.upper() not in updated
+            ]
+            # Entities registered their callbacks with the instruments being replaced
+            callbacks = {
+                (instrument.vehicle.vin, instrument.component, instrument.attr): instrument.callback
+                for instrument in (self.data or [])
+            }
+            for instrument in instruments:
+                if instrument.callback is None:
+                    instrument.callback = callbacks.get(
+                        (instrument.vehicle.vin, instrument.component, instrument.attr)
+                    )
+        else:
+            # Instruments read from the updated vehicle objects, keep serving the same list
+            instruments = self.data
+        return instruments
+
+    @callback
+    def _async_dashboard(self, vehicle):
+        """Return dashboard of a vehicle, created once per vehicle and set of options."""
+        entry = self.entries[vehicle.vin.upper()]
+
         # Backward compatibility
-        default_convert_conf = get_convert_conf(self.entry)
+        default_convert_conf = get_convert_conf(entry)
 
-        convert_conf = self.entry.options.get(
+        convert_conf = entry.options.get(
             CONF_CONVERT,
-            self.entry.data.get(
+            entry.data.get(
                 CONF_CONVERT,
                 default_convert_conf
             )
         )
 
-        dashboard = vehicle.dashboard(
-            mutable=self.entry.options.get(CONF_MUTABLE),
-            spin=self.entry.options.get(CONF_SPIN),
+        config = dict(
+            mutable=entry.options.get(CONF_MUTABLE),
+            spin=entry.options.get(CONF_SPIN),
             miles=convert_conf == CONF_IMPERIAL_UNITS,
             scandinavian_miles=convert_conf == CONF_SCANDINAVIAN_MILES,
         )
+        cached = self._dashboards.get(vehicle.vin.upper())
+        if cached is not None and cached[0] is vehicle and cached[1] == config:
+            return cached[2]
+
+        _LOGGER.debug(f"Creating dashboard for {vehicle.vin}")
+        dashboard = vehicle.dashboard(**config)
+        self._dashboards[vehicle.vin.upper()] = (vehicle, config, dashboard)
+        return dashboard
+
+    @callback
+    def async_add_instrument_listener(self, key, update_callback):
+        """Listen for changes of the instrument identified by (vin, component, attr)."""
+        bucket = self._instrument_listeners.setdefault(key, [])
+        bucket.append(update_callback)
+        # Register with the coordinator as well, it only polls while it has listeners
+        remove_listener = self.async_add_listener(update_callback, key)
+
+        @callback
+        def remove_instrument_listener():
+            remove_listener()
+            bucket.remove(update_callback)
+            if not bucket and self._instrument_listeners.get(key) is bucket:
+                self._instrument_listeners.pop(key)
+
+        return remove_instrument_listener
+
+    @callback
+    def async_update_listeners(self):
+        """Update listeners of instruments that changed since the last update."""
+        first = not self._snapshot
+        with self.stats.timed("diff"):
+            changed = self._async_diff_snapshot()
+        if self.last_update_success and changed:
+            self._async_save_snapshots({key[0] for key in changed})
+        # Sensor values drift while parked, only vehicle state changes warrant fast polling
+        if not first and self.adaptive and any(key[1] != "sensor" for key in changed):
+            self.async_boost()
+
+        # Availability changed, every entity needs to write its state
+        if self.last_update_success != self._notified_success:
+            self._notified_success = self.last_update_success
+            self.stats.finish(len(self._listeners))
+            super().async_update_listeners()
+            return
 
-        return dashboard.instruments
+        written = 0
+        with self.stats.timed("listeners"):
+            for key in changed:
+                for update_callback in list(self._instrument_listeners.get(key, [])):
+                    update_callback()
+                    written += 1
+        # Diagnostic listeners read the statistics, record them first
+        self.stats.finish(written)
+        # Listeners without an instrument context are always updated
+        for update_callback, context in list(self._listeners.values()):
+            if context is None:
+                update_callback()
+
+    @callback
+    def _async_save_snapshots(self, vins):
+        """Store the last known state of vehicles with changed instruments."""
+        for vin in vins:
+            store = self._stores.get(vin.upper())
+            instruments = [
+                instrument
+                for instrument in self.data
+                if instrument.vehicle.vin == vin
+            ]
+            # Restored state is served until the first update, nothing new to store
+            if store is None or not instruments or isinstance(instruments[0], StoredInstrument):
+                continue
+            store.async_delay_save(instruments[0].vehicle, instruments, self._fetched.get(vin.upper()))
+
+    @callback
+    def _async_diff_snapshot(self):
+        """Store a new snapshot of instrument values and return keys that changed."""
+        snapshot = {
+            (instrument.vehicle.vin, instrument.component, instrument.attr): _instrument_snapshot(instrument)
+            for instrument in (self.data or [])
+        }
+        changed = {
+            key
+            for key, values in snapshot.items()
+            if key not in self._snapshot or self._snapshot[key] != values
+        }
+        self._snapshot = snapshot
+        for key in changed:
+            self._generations[key] = self._generations.get(key, 0) + 1
+        return changed
+
+    @callback
+    def async_generation(self, key):
+        """Return how often the instrument of key changed, entities cache derived values per generation."""
+        return self._generations.get(key, 0)
 
     async def async_logout(self, event=None):
-        """Logout from Seat Connect"""
+        """Logout from Seat Connect, tokens are kept for next start unless revoked on stop"""
         _LOGGER.debug("Shutdown Seat Connect")
+        if self._unsub_stop is not None and event is None:
+            self._unsub_stop()
+        self._unsub_stop = None
+        self._logged_in = False
+        if self._history_task is not None:
+            self._history_task.cancel()
+            self._history_task = None
+        if self.connection is None:
+            return True
+
+        if event is None or not self.revoke_tokens:
+            if self.connection._session_tokens:
+                await self._token_store.async_save(self.connection._session_tokens)
+            self.connection = None
+            return True
+
         try:
             await self.connection.terminate()
             self.connection = None
         except Exception as ex:
             _LOGGER.error("Failed to log out and revoke tokens for Seat Connect. Some tokens might still be valid.")
             return False
+        await self._token_store.async_remove()
         return True
 
-    async def async_login(self):
-        """Login to Seat Connect"""
-        # Check if we can login
+    async def _async_resume_session(self):
+        """Reuse stored tokens, return true if they were accepted."""
+        tokens = await self._token_store.async_load()
+        if not tokens:
+            return False
+        self.connection._session_tokens = tokens
         try:
-            if await self.connection.doLogin() is False:
-                _LOGGER.warning(
-                    "Could not login to Seat Connect, please check your credentials and verify that the service is working"
-                )
-                return False
-            # Get associated vehicles before we continue
+            # Tokens are refreshed by the library if they expired
             await self.connection.get_vehicles()
+        except Exception as error:
+            _LOGGER.debug(f"Stored tokens were not accepted, logging in to Seat Connect: {error}")
+            self.connection._session_tokens = {}
+            return False
+        _LOGGER.debug("Resumed Seat Connect session with stored tokens")
+        return True
+
+    @callback
+    def _async_save_tokens(self):
+        """Store tokens of the connection when they were refreshed."""
+        if self.connection is not None:
+            self._token_store.async_delay_save(self.connection._session_tokens)
+
+    async def async_login(self):
+        """Login to Seat Connect, only once for all vehicles on the account"""
+        async with self._login_lock:
+            if self._logged_in:
+                return True
+            # Check if we can login
+            try:
+                if self._handed_over:
+                    # Logged in by the config flow, vehicles are only missing after re-authentication
+                    self._handed_over = False
+                    if not self.connection.vehicles:
+                        await self.connection.get_vehicles()
+                elif not await self._async_resume_session():
+                    if await self.connection.doLogin() is False:
+                        _LOGGER.warning(
+                            "Could not login to Seat Connect, please check your credentials and verify that the service is working"
+                        )
+                        return False
+                    # Get associated vehicles before we continue
+                    await self.connection.get_vehicles()
+            except (SeatAccountLockedException, SeatAuthenticationException) as e:
+                # Raise auth failed error in config flow
+                raise ConfigEntryAuthFailed(e) from e
+            except:
+                raise
+            self._logged_in = True
+            self._async_save_tokens()
+            if self._unsub_stop is None:
+                self._unsub_stop = self.hass.bus.async_listen_once(
+                    EVENT_HOMEASSISTANT_STOP, self.async_logout
+                )
             return True
-        except (SeatAccountLockedException, SeatAuthenticationException) as e:
-            # Raise auth failed error in config flow
-            raise ConfigEntryAuthFailed(e) from e
-        except:
-            raise
 
-    async def update(self) -> Union[bool, Vehicle]:
-        """Update status from Seat Connect"""
+    @callback
+    def _async_sections(self, vin):
+        """Return sections backing the resources enabled for a vehicle, None if all are needed."""
+        entry = self.entries[vin.upper()]
+        resources = entry.options.get(CONF_RESOURCES, entry.data.get(CONF_RESOURCES))
+        if resources is None:
+            return None
+        sections = set()
+        for attr in resources:
+            found = {section for section, attrs in SECTION_ATTRS.items() if attr in attrs}
+            if not found and attr not in SECTIONLESS_ATTRS:
+                # Unknown to the section map, fetch everything to be safe
+                return None
+            sections |= found
+        return sections
+
+    async def _async_update_vehicle(self, vehicle):
+        """Update a vehicle, fetching only the sections its enabled resources need."""
+        sections = self._async_sections(vehicle.vin)
+        if sections is None or len(sections) == len(SECTIONS):
+            return await vehicle.update()
+
+        # Same as the library update, limited to the sections needed
+        if not vehicle._discovered or vehicle._discovered < datetime.now() - timedelta(hours=1):
+            await vehicle.discover()
+        if vehicle.deactivated:
+            _LOGGER.info(f"Vehicle with VIN {vehicle.vin} is deactivated.")
+            return False
+        _LOGGER.debug(f"Updating {', '.join(sorted(sections)) or 'no sections'} for {vehicle.vin}")
+        await asyncio.gather(
+            *(getattr(vehicle, SECTIONS[section])() for section in sorted(sections)),
+            return_exceptions=True,
+        )
+        return True
+
+    async def _async_update_limited(self, semaphore, vehicle):
+        """Update a vehicle once fewer than the maximum number of vehicles are updating."""
+        async with semaphore:
+            return await self._async_update_vehicle(vehicle)
+
+    async def update(self) -> Union[bool, list]:
+        """Update status of all vehicles on the account from Seat Connect"""
 
         # Update vehicle data
         _LOGGER.debug("Updating data from Seat Connect")
+        self._api_calls = 0
+        self._throttled = False
         try:
-            # Get Vehicle object matching VIN number
-            vehicle = self.connection.vehicle(self.vin)
-            if await vehicle.update():
-                return vehicle
-            else:
-                _LOGGER.warning("Could not query update from Seat Connect")
+            # Get Vehicle objects matching VIN numbers and update them concurrently
+            vehicles = []
+            failed = []
+            for vin in self.entries:
+                vehicle = self.connection.vehicle(vin)
+                if vehicle is None:
+                    _LOGGER.warning(f"Vehicle {vin} was not found on the Seat Connect account")
+                    failed.append(vin)
+                else:
+                    vehicles.append(vehicle)
+            semaphore = asyncio.Semaphore(self.max_concurrent_updates)
+            with self.stats.timed("update"):
+                results = await asyncio.gather(
+                    *(self._async_update_limited(semaphore, vehicle) for vehicle in vehicles),
+                    return_exceptions=True,
+                )
+            if self._throttled or any(isinstance(result, SeatThrottledException) for result in results):
+                raise SeatThrottledException("Too many requests")
+
+            # A failed vehicle keeps its last data, without a dashboard its previous instruments are kept
+            updated = []
+            for vehicle, result in zip(vehicles, results):
+                if isinstance(result, Exception) or not result:
+                    _LOGGER.warning(
+                        f"Could not query update of {vehicle.vin} from Seat Connect"
+                        + (f": {result}" if isinstance(result, Exception) else "")
+                    )
+                    failed.append(vehicle.vin.upper())
+                    if vehicle.vin.upper() not in self._dashboards:
+                        continue
+                else:
+                    self._fetched[vehicle.vin.upper()] = dt_util.utcnow()
+                updated.append(vehicle)
+            self.failed_vehicles = failed
+            if len(failed) == len(self.entries):
                 return False
+            return updated
+        except SeatThrottledException:
+            raise
         except Exception as error:
             _LOGGER.warning(f"An error occured while requesting update from Seat Connect: {error}")
             return False
+        finally:
+            self._async_save_tokens()
+            self.budget.consume(self._api_calls)
+            self.stats.count_api_calls(self._api_calls)
+            if self._api_calls:
+                self._api_calls_last = self._api_calls
@@ -4,9 +4,8 @@ Support for Seat Connect.
 import logging
 
 from homeassistant.components.binary_sensor import DEVICE_CLASSES, BinarySensorEntity
-from homeassistant.const import CONF_RESOURCES
 
-from . import UPDATE_CALLBACK, DATA, DATA_KEY, DOMAIN, SeatEntity
+from . import UPDATE_CALLBACK, DATA_KEY, DOMAIN, SeatEntity, async_add_platform_entities
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,25 +18,9 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
 
 
 async def async_setup_entry(hass, entry, async_add_devices):
-    data = hass.data[DOMAIN][entry.entry_id][DATA]
-    coordinator = data.coordinator
-    if coordinator.data is not None:
-        if CONF_RESOURCES in entry.options:
-            resources = entry.options[CONF_RESOURCES]
-        else:
-            resources = entry.data[CONF_RESOURCES]
-
-        async_add_devices(
-            SeatBinarySensor(
-                data, instrument.vehicle_name, instrument.component, instrument.attr, hass.data[DOMAIN][entry.entry_id][UPDATE_CALLBACK]
-            )
-            for instrument in (
-                instrument
-                for instrument in data.instruments
-                if instrument.component == "binary_sensor" and instrument.attr in resources
-            )
-        )
-
+    async_add_platform_entities(
+        hass, entry, async_add_devices, "binary_sensor", SeatBinarySensor, hass.data[DOMAIN][entry.entry_id][UPDATE_CALLBACK]
+    )
     return True
 
 
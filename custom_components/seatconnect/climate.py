@@ -15,12 +15,11 @@ from homeassistant.const import (
     STATE_UNKNOWN,
     TEMP_CELSIUS,
     TEMP_FAHRENHEIT,
-    CONF_RESOURCES
 )
 
 SUPPORT_HVAC = [HVAC_MODE_COOL, HVAC_MODE_HEAT, HVAC_MODE_OFF]
 
-from . import DATA, DATA_KEY, DOMAIN, SeatEntity
+from . import DATA_KEY, SeatEntity, async_add_platform_entities
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,25 +32,7 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
 
 
 async def async_setup_entry(hass, entry, async_add_devices):
-    data = hass.data[DOMAIN][entry.entry_id][DATA]
-    coordinator = data.coordinator
-    if coordinator.data is not None:
-        if CONF_RESOURCES in entry.options:
-            resources = entry.options[CONF_RESOURCES]
-        else:
-            resources = entry.data[CONF_RESOURCES]
-
-        async_add_devices(
-            SeatClimate(
-                data, instrument.vehicle_name, instrument.component, instrument.attr
-            )
-            for instrument in (
-                instrument
-                for instrument in data.instruments
-                if instrument.component == "climate" and instrument.attr in resources
-            )
-        )
-
+    async_add_platform_entities(hass, entry, async_add_devices, "climate", SeatClimate)
     return True
 
 
@@ -101,11 +82,20 @@ class SeatClimate(SeatEntity, ClimateEntity):
         """Set new target temperatures."""
         temperature = kwargs.get(ATTR_TEMPERATURE)
         if temperature:
-            await self.instrument.set_temperature(temperature)
+            await self.async_command(
+                f"{self.attribute}_temperature",
+                self.instrument.set_temperature,
+                temperature,
+                done=lambda: self.target_temperature == float(temperature),
+            )
 
     async def async_set_hvac_mode(self, hvac_mode):
         """Set new target hvac mode."""
         if hvac_mode == HVAC_MODE_OFF:
-            await self.instrument.set_hvac_mode(False)
+            await self.async_command(
+                self.attribute, self.instrument.set_hvac_mode, False, done=lambda: self.hvac_mode == HVAC_MODE_OFF
+            )
         elif hvac_mode == HVAC_MODE_HEAT:
-            await self.instrument.set_hvac_mode(True)
+            await self.async_command(
+                self.attribute, self.instrument.set_hvac_mode, True, done=lambda: self.hvac_mode == HVAC_MODE_HEAT
+            )
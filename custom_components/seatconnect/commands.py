@@ -0,0 +1,148 @@
+"""
+Command queue for Seat Connect vehicles
+"""
+import asyncio
+import logging
+from collections import OrderedDict
+from time import monotonic
+
+from homeassistant.exceptions import HomeAssistantError
+
+from seatconnect.exceptions import SeatRequestInProgressException
+
+from .const import COMMAND_RETRIES, COMMAND_RETRY_DELAY
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SeatCommand:
+    """A write request to a vehicle and the callers waiting for its result.
+
+    done() returns true once vehicle data reflects the request, None if any change does.
+    """
+
+    def __init__(self, key, action, args, done=None):
+        """Initialize the command."""
+        self.key = key
+        self.action = action
+        self.args = args
+        self.done = done
+        self.futures = []
+        self.started = None
+
+    def supersede(self, action, args, done=None):
+        """Replace the request with a newer one for the same setting."""
+        self.action = action
+        self.args = args
+        self.done = done
+
+    def resolve(self, result=None, error=None):
+        """Hand the result to every caller still waiting."""
+        for future in self.futures:
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+
+class SeatCommandQueue:
+    """Runs write requests to a vehicle one at a time, in the order they were made.
+
+    A request for a setting that is still waiting in the queue replaces the
+    earlier one, callers of both get the result of the request that was run.
+    Requests are in flight until the library returns, which is when the car
+    confirmed the request or gave up on it. completed(vin, command, result)
+    is called once for every request run without error.
+    """
+
+    def __init__(self, hass, vin, completed=None):
+        """Initialize an empty queue."""
+        self.hass = hass
+        self.vin = vin
+        self._completed = completed
+        self.in_flight = None
+        self.completed = 0
+        self.coalesced = 0
+        self._pending = OrderedDict()
+        self._task = None
+
+    @property
+    def pending(self):
+        """Return number of requests waiting to be run."""
+        return len(self._pending)
+
+    async def async_submit(self, key, action, *args, done=None):
+        """Queue action(*args) as the latest request for key and return its result."""
+        future = self.hass.loop.create_future()
+        command = self._pending.get(key)
+        if command is not None:
+            _LOGGER.debug(f"Replacing queued request {key} for {self.vin}")
+            command.supersede(action, args, done)
+            self.coalesced += 1
+        else:
+            command = self._pending[key] = SeatCommand(key, action, args, done)
+        command.futures.append(future)
+
+        if self._task is None:
+            self._task = self.hass.async_create_task(self._async_run())
+        return await future
+
+    async def _async_run(self):
+        """Run queued requests until the queue is empty."""
+        try:
+            while self._pending:
+                _, command = self._pending.popitem(last=False)
+                self.in_flight = command
+                command.started = monotonic()
+                try:
+                    result = await self._async_execute(command)
+                except asyncio.CancelledError:
+                    command.resolve(error=HomeAssistantError(f"Request {command.key} was cancelled"))
+                    raise
+                except Exception as error:
+                    command.resolve(error=error)
+                else:
+                    command.resolve(result)
+                    if self._completed is not None:
+                        self._completed(self.vin, command, result)
+                finally:
+                    self.in_flight = None
+                    self.completed += 1
+        finally:
+            self._task = None
+
+    async def _async_execute(self, command):
+        """Run a request, retried while the car is busy with a request made elsewhere."""
+        for attempt in range(COMMAND_RETRIES + 1):
+            try:
+                return await command.action(*command.args)
+            except SeatRequestInProgressException:
+                if attempt == COMMAND_RETRIES:
+                    raise
+                _LOGGER.debug(
+                    f"Request {command.key} for {self.vin} waits for a request in progress, "
+                    f"retrying in {COMMAND_RETRY_DELAY} seconds"
+                )
+                await asyncio.sleep(COMMAND_RETRY_DELAY)
+
+    def as_dict(self):
+        """Return queue state for diagnostics."""
+        return {
+            "pending": [str(key) for key in self._pending],
+            "in_flight": None if self.in_flight is None else {
+                "request": str(self.in_flight.key),
+                "seconds": round(monotonic() - self.in_flight.started),
+            },
+            "completed": self.completed,
+            "coalesced": self.coalesced,
+        }
+
+    def async_shutdown(self):
+        """Stop running requests, callers still waiting get an error."""
+        for command in self._pending.values():
+            command.resolve(error=HomeAssistantError(f"Request {command.key} was cancelled"))
+        self._pending.clear()
+        if self._task is not None:
+            self._task.cancel()
@@ -13,7 +13,7 @@ from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from seatconnect import Connection
-from . import get_convert_conf
+from . import get_convert_conf, parse_deadbands
 from .const import (
     CONF_CONVERT,
     CONF_SCANDINAVIAN_MILES,
@@ -25,10 +25,27 @@ from .const import (
     CONF_SPIN,
     CONF_VEHICLE,
     CONF_INSTRUMENTS,
+    CONF_ADAPTIVE_POLLING,
+    DEFAULT_ADAPTIVE_POLLING,
+    CONF_REVOKE_TOKENS,
+    DEFAULT_REVOKE_TOKENS,
+    CONF_POSITION_DEADBAND,
+    DEFAULT_POSITION_DEADBAND,
+    CONF_SENSOR_DEADBANDS,
+    DEFAULT_SENSOR_DEADBANDS,
+    CONF_REPUBLISH_INTERVAL,
+    DEFAULT_REPUBLISH_INTERVAL,
+    CONF_MAX_CONCURRENT_UPDATES,
+    DEFAULT_MAX_CONCURRENT_UPDATES,
+    CONF_REFRESH_COOLDOWN,
+    DEFAULT_REFRESH_COOLDOWN,
+    CONF_REQUEST_BUDGET,
+    DEFAULT_REQUEST_BUDGET,
     MIN_SCAN_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
-    DEFAULT_DEBUG
+    DEFAULT_DEBUG,
+    PENDING_CONNECTIONS,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -67,6 +84,11 @@ class SeatConnectConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 CONF_CONVERT: CONF_NO_CONVERSION,
                 CONF_MUTABLE: True,
                 CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL,
+                CONF_ADAPTIVE_POLLING: DEFAULT_ADAPTIVE_POLLING,
+                CONF_REVOKE_TOKENS: DEFAULT_REVOKE_TOKENS,
+                CONF_POSITION_DEADBAND: DEFAULT_POSITION_DEADBAND,
+                CONF_SENSOR_DEADBANDS: DEFAULT_SENSOR_DEADBANDS,
+                CONF_REPUBLISH_INTERVAL: DEFAULT_REPUBLISH_INTERVAL,
                 CONF_DEBUG: False,
                 CONF_SPIN: None,
                 CONF_RESOURCES: []
@@ -149,13 +171,15 @@ class SeatConnectConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             await self.async_set_unique_id(self._data[CONF_VEHICLE])
             self._abort_if_unique_id_configured()
 
+            self._async_hand_over_connection()
             return self.async_create_entry(
                 title=self._data[CONF_VEHICLE],
                 data=self._data,
                 options=self._options
             )
 
-        instruments = self._init_info["CONF_VEHICLES"][self._data[CONF_VEHICLE]]
+        # Only the selected vehicle needs its instruments
+        instruments = self._init_info["CONF_VEHICLES"][self._data[CONF_VEHICLE]].dashboard().instruments
         instruments_dict = {
             instrument.attr: instrument.name for instrument in instruments
         }
@@ -231,11 +255,16 @@ class SeatConnectConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return self.async_abort(reason="Could not find any vehicles associated with account!")
 
         self._init_info["CONF_VEHICLES"] = {
-            vehicle.vin: vehicle.dashboard().instruments
-            for vehicle in self._connection.vehicles
+            vehicle.vin: vehicle for vehicle in self._connection.vehicles
         }
         return self.async_show_progress_done(next_step_id="vehicle")
 
+    @callback
+    def _async_hand_over_connection(self):
+        """Let setup of the entry reuse the logged in connection instead of logging in again."""
+        pending = self.hass.data.setdefault(DOMAIN, {}).setdefault(PENDING_CONNECTIONS, {})
+        pending[self._connection._session_auth_username.lower()] = self._connection
+
 
     async def async_step_reauth(self, entry) -> dict:
         """Handle initiation of re-authentication with Seat Connect."""
@@ -270,6 +299,7 @@ class SeatConnectConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                             CONF_PASSWORD: user_input[CONF_PASSWORD],
                         },
                     )
+                    self._async_hand_over_connection()
                     self.hass.async_create_task(
                         self.hass.config_entries.async_reload(self.entry.entry_id)
                     )
@@ -303,6 +333,11 @@ class SeatConnectConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             CONF_CONVERT: CONF_NO_CONVERSION,
             CONF_MUTABLE: True,
             CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL,
+            CONF_ADAPTIVE_POLLING: DEFAULT_ADAPTIVE_POLLING,
+            CONF_REVOKE_TOKENS: DEFAULT_REVOKE_TOKENS,
+            CONF_POSITION_DEADBAND: DEFAULT_POSITION_DEADBAND,
+            CONF_SENSOR_DEADBANDS: DEFAULT_SENSOR_DEADBANDS,
+            CONF_REPUBLISH_INTERVAL: DEFAULT_REPUBLISH_INTERVAL,
             CONF_DEBUG: False,
             CONF_SPIN: None,
             CONF_RESOURCES: []
@@ -355,8 +390,7 @@ class SeatConnectConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if len(self._connection.vehicles) == 0:
             return self.async_abort(reason="Seat Connect account didn't return any vehicles")
         self._init_info["CONF_VEHICLES"] = {
-            vehicle.vin: vehicle.dashboard().instruments
-            for vehicle in self._connection.vehicles
+            vehicle.vin: vehicle for vehicle in self._connection.vehicles
         }
 
         if self._data[CONF_VEHICLE] is None:
@@ -367,7 +401,7 @@ class SeatConnectConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         await self.async_set_unique_id(self._data[CONF_VEHICLE])
         self._abort_if_unique_id_configured()
 
-        instruments = self._init_info["CONF_VEHICLES"][self._data[CONF_VEHICLE]]
+        instruments = self._init_info["CONF_VEHICLES"][self._data[CONF_VEHICLE]].dashboard().instruments
         self._data[CONF_INSTRUMENTS] = {
             instrument.attr: instrument.name for instrument in instruments
         }
@@ -377,6 +411,7 @@ class SeatConnectConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 if resource in self._data[CONF_INSTRUMENTS]:
                     self._options[CONF_RESOURCES].append(resource)
 
+        self._async_hand_over_connection()
         return self.async_create_entry(
             title=self._data[CONF_VEHICLE],
             data=self._data,
@@ -407,7 +442,13 @@ class SeatConnectOptionsFlowHandler(config_entries.OptionsFlow):
 
     async def async_step_user(self, user_input=None):
         """Manage the options."""
+        errors = {}
         if user_input is not None:
+            try:
+                parse_deadbands(user_input.get(CONF_SENSOR_DEADBANDS, ""))
+            except ValueError:
+                errors[CONF_SENSOR_DEADBANDS] = "invalid_deadbands"
+        if user_input is not None and not errors:
             # Remove some options from "data", theese are to be stored in options
             data = self._config_entry.data.copy()
             if "spin" in data and user_input.get(CONF_SPIN, "") != "":
@@ -418,9 +459,17 @@ class SeatConnectOptionsFlowHandler(config_entries.OptionsFlow):
 
             options = self._config_entry.options.copy()
             options[CONF_SCAN_INTERVAL] = user_input.get(CONF_SCAN_INTERVAL, 1)
+            options[CONF_ADAPTIVE_POLLING] = user_input.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING)
             options[CONF_SPIN] = user_input.get(CONF_SPIN, None)
             options[CONF_MUTABLE] = user_input.get(CONF_MUTABLE, True)
             options[CONF_DEBUG] = user_input.get(CONF_DEBUG, False)
+            options[CONF_REVOKE_TOKENS] = user_input.get(CONF_REVOKE_TOKENS, DEFAULT_REVOKE_TOKENS)
+            options[CONF_POSITION_DEADBAND] = user_input.get(CONF_POSITION_DEADBAND, DEFAULT_POSITION_DEADBAND)
+            options[CONF_SENSOR_DEADBANDS] = user_input.get(CONF_SENSOR_DEADBANDS, "")
+            options[CONF_REPUBLISH_INTERVAL] = user_input.get(CONF_REPUBLISH_INTERVAL, DEFAULT_REPUBLISH_INTERVAL)
+            options[CONF_MAX_CONCURRENT_UPDATES] = user_input.get(CONF_MAX_CONCURRENT_UPDATES, DEFAULT_MAX_CONCURRENT_UPDATES)
+            options[CONF_REFRESH_COOLDOWN] = user_input.get(CONF_REFRESH_COOLDOWN, DEFAULT_REFRESH_COOLDOWN)
+            options[CONF_REQUEST_BUDGET] = user_input.get(CONF_REQUEST_BUDGET, DEFAULT_REQUEST_BUDGET)
             options[CONF_RESOURCES] = user_input.get(CONF_RESOURCES, [])
             options[CONF_CONVERT] = user_input.get(CONF_CONVERT, CONF_NO_CONVERSION)
             return self.async_create_entry(
@@ -460,6 +509,49 @@ class SeatConnectOptionsFlowHandler(config_entries.OptionsFlow):
                         vol.Coerce(int),
                         vol.Range(min=MIN_SCAN_INTERVAL, max=900)
                     ),
+                    vol.Optional(
+                        CONF_ADAPTIVE_POLLING,
+                        default=self._config_entry.options.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING)
+                    ): cv.boolean,
+                    vol.Optional(
+                        CONF_MAX_CONCURRENT_UPDATES,
+                        default=self._config_entry.options.get(CONF_MAX_CONCURRENT_UPDATES, DEFAULT_MAX_CONCURRENT_UPDATES)
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=1, max=20)
+                    ),
+                    vol.Optional(
+                        CONF_REFRESH_COOLDOWN,
+                        default=self._config_entry.options.get(CONF_REFRESH_COOLDOWN, DEFAULT_REFRESH_COOLDOWN)
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=0, max=300)
+                    ),
+                    vol.Optional(
+                        CONF_REQUEST_BUDGET,
+                        default=self._config_entry.options.get(CONF_REQUEST_BUDGET, DEFAULT_REQUEST_BUDGET)
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=50, max=100000)
+                    ),
+                    vol.Optional(
+                        CONF_POSITION_DEADBAND,
+                        default=self._config_entry.options.get(CONF_POSITION_DEADBAND, DEFAULT_POSITION_DEADBAND)
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=0, max=1000)
+                    ),
+                    vol.Optional(
+                        CONF_SENSOR_DEADBANDS,
+                        default=self._config_entry.options.get(CONF_SENSOR_DEADBANDS, DEFAULT_SENSOR_DEADBANDS)
+                    ): cv.string,
+                    vol.Optional(
+                        CONF_REPUBLISH_INTERVAL,
+                        default=self._config_entry.options.get(CONF_REPUBLISH_INTERVAL, DEFAULT_REPUBLISH_INTERVAL)
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=0, max=86400)
+                    ),
                     vol.Optional(
                         CONF_SPIN,
                         default=self._config_entry.options.get(CONF_SPIN,
@@ -478,6 +570,10 @@ class SeatConnectOptionsFlowHandler(config_entries.OptionsFlow):
                             self._config_entry.data.get(CONF_DEBUG, False)
                         )
                     ): cv.boolean,
+                    vol.Optional(
+                        CONF_REVOKE_TOKENS,
+                        default=self._config_entry.options.get(CONF_REVOKE_TOKENS, DEFAULT_REVOKE_TOKENS)
+                    ): cv.boolean,
                     vol.Optional(
                         CONF_RESOURCES,
                         default=self._config_entry.options.get(CONF_RESOURCES,
@@ -490,4 +586,5 @@ class SeatConnectOptionsFlowHandler(config_entries.OptionsFlow):
                     ): vol.In(CONVERT_DICT)
                 }
             ),
+            errors=errors,
         )
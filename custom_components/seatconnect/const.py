@@ -14,6 +14,14 @@ CONF_CONVERT = "convert"
 CONF_VEHICLE = "vehicle"
 CONF_INSTRUMENTS = "instruments"
 CONF_DEBUG = "debug"
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_REVOKE_TOKENS = "revoke_tokens"
+CONF_POSITION_DEADBAND = "position_deadband"
+CONF_SENSOR_DEADBANDS = "sensor_deadbands"
+CONF_REPUBLISH_INTERVAL = "republish_interval"
+CONF_MAX_CONCURRENT_UPDATES = "max_concurrent_updates"
+CONF_REFRESH_COOLDOWN = "refresh_cooldown"
+CONF_REQUEST_BUDGET = "request_budget"
 
 # Service definitions
 SERVICE_SET_SCHEDULE = "set_departure_schedule"
@@ -24,6 +32,10 @@ SERVICE_SET_PHEATER_DURATION = "set_pheater_duration"
 
 UPDATE_CALLBACK = "update_callback"
 DATA = "data"
+COORDINATORS = "coordinators"
+DEVICE_INDEX = "device_index"
+SERVICE_REFS = "service_refs"
+PENDING_CONNECTIONS = "pending_connections"
 UNDO_UPDATE_LISTENER = "undo_update_listener"
 
 SIGNAL_STATE_UPDATED = f"{DOMAIN}.updated"
@@ -31,6 +43,137 @@ SIGNAL_STATE_UPDATED = f"{DOMAIN}.updated"
 MIN_SCAN_INTERVAL = 10
 DEFAULT_SCAN_INTERVAL = 120
 
+# Adaptive polling, intervals in seconds
+DEFAULT_ADAPTIVE_POLLING = False
+RELAXED_SCAN_INTERVAL = 900
+NIGHT_SCAN_INTERVAL = 3600
+NIGHT_START = 0
+NIGHT_END = 6
+BOOST_DURATION = 600
+
+# Refresh requests (update entity, force refresh) within this window (seconds) result in one refresh
+DEFAULT_REFRESH_COOLDOWN = 10
+
+# Vehicles of an account updated at the same time
+DEFAULT_MAX_CONCURRENT_UPDATES = 4
+
+# API request budget, Seat Connect allows about 1000 requests per day
+# A quarter of the daily budget can be spent at once, the rest is spread over the day
+DEFAULT_REQUEST_BUDGET = 1000
+REQUEST_BUDGET_BURST = 0.25
+API_CALLS_PER_VEHICLE = 7
+BACKOFF_BASE = 60
+BACKOFF_MAX = 3600
+
+# Keep tokens for the next start instead of revoking them on shutdown
+DEFAULT_REVOKE_TOKENS = False
+
+# Position changes within this distance (in meters) are GPS jitter of a parked car
+DEFAULT_POSITION_DEADBAND = 25
+
+# Sensor changes within these deadbands are noise, "attr=value" is absolute in the unit of the sensor
+# and "attr=value%" relative to the published value
+DEFAULT_SENSOR_DEADBANDS = (
+    "battery_level=2, electric_range=3, combustion_range=5, combined_range=5, fuel_level=2, "
+    "outside_temperature=0.5, charging_power=5%, charge_rate=5%"
+)
+# Changes within the deadband are still published if the published value is older (in seconds)
+DEFAULT_REPUBLISH_INTERVAL = 3600
+
+# Persistent storage, the last known state is saved at most once per delay (seconds)
+STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 60
+TOKEN_SAVE_DELAY = 10
+
+# Import of trip history into long-term statistics, interval in seconds
+HISTORY_IMPORT_INTERVAL = 6 * 3600
+HISTORY_BATCH_SIZE = 500
+
+# Commands retried when the car is busy with another request, delay in seconds
+COMMAND_RETRIES = 3
+COMMAND_RETRY_DELAY = 15
+
+# Follow-up polls after a request, first delay doubles up to the max until the timeout (seconds)
+FOLLOW_UP_DELAY = 10
+FOLLOW_UP_MAX_DELAY = 60
+FOLLOW_UP_TIMEOUT = 300
+
+# Vehicle data sections, by the library method fetching them
+SECTIONS = {
+    "status": "get_statusreport",
+    "position": "get_position",
+    "trips": "get_trip_statistic",
+    "climater": "get_climater",
+    "charger": "get_charger",
+    "timers": "get_timerprogramming",
+    "preheater": "get_preheater",
+}
+
+# Instruments by the section their data is read from
+SECTION_ATTRS = {
+    "status": [
+        "distance", "last_connected", "parking_light", "outside_temperature",
+        "service_inspection", "service_inspection_distance", "oil_inspection", "oil_inspection_distance",
+        "adblue_level", "fuel_level", "combustion_range", "combined_range", "electric_range",
+        "door_locked", "door_closed_left_front", "door_closed_right_front", "door_closed_left_back",
+        "door_closed_right_back", "trunk_locked", "trunk_closed", "hood_closed", "sunroof_closed",
+        "windows_closed", "window_closed_left_front", "window_closed_left_back",
+        "window_closed_right_front", "window_closed_right_back",
+    ],
+    "position": ["position", "parking_time", "vehicle_moving", "requests_remaining"],
+    "trips": [
+        "trip_last_average_speed", "trip_last_average_electric_consumption",
+        "trip_last_average_fuel_consumption", "trip_last_duration", "trip_last_length",
+        "trip_last_recuperation", "trip_last_average_recuperation",
+        "trip_last_average_auxillary_consumption", "trip_last_average_aux_consumer_consumption",
+        "trip_last_total_electric_consumption",
+    ],
+    "climater": [
+        "electric_climatisation", "auxiliary_climatisation", "climatisation_target_temperature",
+        "climatisation_without_external_power", "climatisation_time_left", "window_heater", "seat_heating",
+    ],
+    "charger": [
+        "battery_level", "charging", "charging_power", "charge_rate", "charging_time_left",
+        "charge_max_ampere", "external_power", "energy_flow", "charging_cable_connected",
+        "charging_cable_locked", "electric_range",
+    ],
+    "timers": ["departure1", "departure2", "departure3", "min_charge_level"],
+    "preheater": ["pheater_heating", "pheater_ventilation", "pheater_status", "pheater_duration"],
+}
+
+# Instruments read from vehicle information or request state, no section needed
+SECTIONLESS_ATTRS = [
+    "model_image_large", "model_image_small", "refresh_data", "request_flash",
+    "request_honkandflash", "request_in_progress", "request_results",
+]
+
+# Section changed by requests, by command key
+COMMAND_SECTIONS = {
+    "electric_climatisation": "climater",
+    "electric_climatisation_temperature": "climater",
+    "auxiliary_climatisation": "climater",
+    "window_heater": "climater",
+    "climatisation_without_external_power": "climater",
+    "set_climater": "climater",
+    "charging": "charger",
+    "set_current": "charger",
+    "door_locked": "status",
+    "trunk_locked": "status",
+    "departure1": "timers",
+    "departure2": "timers",
+    "departure3": "timers",
+    "set_schedule_1": "timers",
+    "set_schedule_2": "timers",
+    "set_schedule_3": "timers",
+    "set_charge_limit": "timers",
+    "pheater_heating": "preheater",
+    "pheater_heating_temperature": "preheater",
+    "pheater_ventilation": "preheater",
+}
+
+# Number of refreshes kept for timing statistics
+REFRESH_STATS_SAMPLES = 100
+
 CONVERT_DICT = {
     CONF_NO_CONVERSION: "No conversion",
     CONF_IMPERIAL_UNITS: "Imperial units",
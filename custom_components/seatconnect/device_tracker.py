@@ -2,38 +2,31 @@
 Support for Seat Connect Platform
 """
 import logging
+from math import asin, cos, radians, sin, sqrt
 
 from homeassistant.components.device_tracker import SourceType
 from homeassistant.components.device_tracker.config_entry import TrackerEntity
+from homeassistant.core import callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.util import slugify
-from homeassistant.const import CONF_RESOURCES
 
-from . import DATA, DATA_KEY, DOMAIN, SIGNAL_STATE_UPDATED, SeatEntity
+from . import DATA_KEY, SIGNAL_STATE_UPDATED, SeatEntity, async_add_platform_entities
+from .const import CONF_POSITION_DEADBAND, DEFAULT_POSITION_DEADBAND
 
 _LOGGER = logging.getLogger(__name__)
 
+EARTH_RADIUS = 6371008.8
 
-async def async_setup_entry(hass, entry, async_add_devices):
-    data = hass.data[DOMAIN][entry.entry_id][DATA]
-    coordinator = data.coordinator
-    if coordinator.data is not None:
-        if CONF_RESOURCES in entry.options:
-            resources = entry.options[CONF_RESOURCES]
-        else:
-            resources = entry.data[CONF_RESOURCES]
-
-        async_add_devices(
-            SeatDeviceTracker(
-                data, instrument.vehicle_name, instrument.component, instrument.attr
-            )
-            for instrument in (
-                instrument
-                for instrument in data.instruments
-                if instrument.component == "device_tracker" and instrument.attr in resources
-            )
-        )
 
+def haversine(origin, destination):
+    """Return the distance in meters between two (latitude, longitude) positions."""
+    lat1, lon1, lat2, lon2 = map(radians, (*origin, *destination))
+    a = sin((lat2 - lat1) / 2) ** 2 + cos(lat1) * cos(lat2) * sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS * asin(sqrt(a))
+
+
+async def async_setup_entry(hass, entry, async_add_devices):
+    async_add_platform_entities(hass, entry, async_add_devices, "device_tracker", SeatDeviceTracker)
     return True
 
 
@@ -65,15 +58,65 @@ async def async_setup_scanner(hass, config, async_see, discovery_info=None):
 
 
 class SeatDeviceTracker(SeatEntity, TrackerEntity):
+    def __init__(self, *args, **kwargs):
+        """Initialize the tracker."""
+        super().__init__(*args, **kwargs)
+        self._position = None
+        self._written = None
+
+    def _reported(self):
+        """Return the reported position, None while the vehicle is moving or the position is unknown."""
+        try:
+            return float(self.instrument.state[0]), float(self.instrument.state[1])
+        except (TypeError, ValueError, IndexError):
+            return None
+
+    @property
+    def _deadband(self):
+        return self.data.options.get(CONF_POSITION_DEADBAND, DEFAULT_POSITION_DEADBAND)
+
+    @callback
+    def _async_instrument_changed(self):
+        """Write the state unless the position moved less than the deadband."""
+        reported = self._reported()
+        if (
+            reported is not None
+            and self._position is not None
+            and self._written == (self._position, self.available)
+            and haversine(self._position, reported) < self._deadband
+        ):
+            _LOGGER.debug(f"Position of {self.vin} moved less than {self._deadband} m, not published")
+            return
+        self._position = reported
+        self.async_write_ha_state()
+
+    @callback
+    def async_write_ha_state(self):
+        """Write the state, remembering what was published."""
+        if self._position is None:
+            self._position = self._reported()
+        super().async_write_ha_state()
+        self._written = (self._position, self.available)
+
+    @property
+    def moving(self):
+        """Return true if the vehicle is moving, it reports no position while driving."""
+        return bool(getattr(self.vehicle, "vehicle_moving", False))
+
     @property
     def latitude(self) -> float:
         """Return latitude value of the device."""
-        return self.instrument.state[0]
+        return self._position[0] if self._position is not None else None
 
     @property
     def longitude(self) -> float:
         """Return longitude value of the device."""
-        return self.instrument.state[1]
+        return self._position[1] if self._position is not None else None
+
+    @property
+    def extra_state_attributes(self):
+        """Return extra state attributes."""
+        return dict(super().extra_state_attributes, moving=self.moving)
 
     @property
     def source_type(self):
@@ -0,0 +1,71 @@
+"""
+Device lookup for Seat Connect services
+"""
+import logging
+
+from homeassistant.core import callback
+from homeassistant.helpers import device_registry
+
+from seatconnect.exceptions import SeatConfigException
+
+from .const import COORDINATORS, DEVICE_INDEX, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_get_device_index(hass):
+    """Return the device index, created on first use."""
+    index = hass.data[DOMAIN].get(DEVICE_INDEX)
+    if index is None:
+        index = hass.data[DOMAIN][DEVICE_INDEX] = SeatDeviceIndex(hass)
+    return index
+
+
+class SeatDeviceIndex:
+    """Resolves device ids to VIN and coordinator, rebuilt after device registry updates."""
+
+    def __init__(self, hass):
+        """Initialize the index, built on first lookup."""
+        self.hass = hass
+        self._devices = None
+        self._unsub = hass.bus.async_listen(
+            device_registry.EVENT_DEVICE_REGISTRY_UPDATED, self.async_invalidate
+        )
+
+    @callback
+    def async_invalidate(self, event=None):
+        """Rebuild the index on next lookup, devices or vehicles changed."""
+        self._devices = None
+
+    @callback
+    def async_shutdown(self):
+        """Stop following device registry updates."""
+        self._unsub()
+
+    @callback
+    def _async_build(self):
+        """Index devices of the integration by id."""
+        coordinators = {
+            vin: coordinator
+            for coordinator in self.hass.data[DOMAIN].get(COORDINATORS, {}).values()
+            for vin in coordinator.entries
+        }
+        devices = {}
+        for device in device_registry.async_get(self.hass).devices.values():
+            for domain, vin in device.identifiers:
+                # A device may belong to more than one entry, the account coordinator polls the VIN
+                if domain == DOMAIN and vin.upper() in coordinators:
+                    devices[device.id] = (vin, coordinators[vin.upper()])
+        _LOGGER.debug(f"Indexed {len(devices)} Seat Connect devices")
+        return devices
+
+    @callback
+    def async_resolve(self, device_id):
+        """Return VIN and coordinator of a device."""
+        if self._devices is None:
+            self._devices = self._async_build()
+        try:
+            return self._devices[device_id]
+        except KeyError:
+            raise SeatConfigException(f"Could not find a Seat Connect vehicle for device {device_id}") from None
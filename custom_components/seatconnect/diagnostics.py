@@ -0,0 +1,51 @@
+"""
+Diagnostics support for Seat Connect
+"""
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+
+from .const import CONF_SPIN, CONF_VEHICLE, DATA, DOMAIN
+
+TO_REDACT = {CONF_USERNAME, CONF_PASSWORD, CONF_SPIN, CONF_VEHICLE}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry):
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id][DATA].coordinator
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "coordinator": {
+            "vehicles": len(coordinator.entries),
+            "update_interval": str(coordinator.update_interval),
+            "last_update_success": coordinator.last_update_success,
+            "instruments": len(coordinator.data or []),
+            "max_concurrent_updates": coordinator.max_concurrent_updates,
+            "failed_vehicles": len(coordinator.failed_vehicles),
+            "refresh_requests": coordinator.refresh_requests,
+            "coalesced_requests": coordinator.coalesced_requests,
+        },
+        "request_budget": {
+            "tokens": int(coordinator.budget.tokens),
+            "capacity": coordinator.budget.capacity,
+            "requests_per_day": coordinator.budget.per_day,
+            "requests_per_update": coordinator.api_calls_estimate,
+            "sustained_interval": int(coordinator.budget.interval(coordinator.api_calls_estimate)),
+            "deferred_updates": coordinator.budget.deferred,
+            "throttle_count": coordinator.budget.throttle_count,
+            "backoff": int(coordinator.budget.backoff),
+        },
+        "refresh": coordinator.stats.as_dict(),
+        "commands": {
+            f"vehicle_{index}": queue.as_dict()
+            for index, queue in enumerate(coordinator.commands.values())
+        },
+        "history": {
+            f"vehicle_{index}": {"imported_records": history.imported}
+            for index, history in enumerate(coordinator.history.values())
+        },
+    }
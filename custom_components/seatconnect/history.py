@@ -0,0 +1,125 @@
+"""
+Import of vehicle history into long-term statistics
+"""
+import logging
+
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+from seatconnect.const import BRAND, COUNTRY
+from seatconnect.exceptions import SeatThrottledException
+
+from .const import CONF_VEHICLE, DOMAIN, HISTORY_BATCH_SIZE, STORAGE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+# Statistics imported from trips: key, name, unit and value of a trip
+TRIP_STATISTICS = [
+    ("trip_distance", "Trip distance", "km", lambda trip: trip.get("mileage")),
+    ("trip_duration", "Trip duration", "min", lambda trip: trip.get("traveltime")),
+]
+
+
+async def async_fetch_trips(connection, vehicle):
+    """Return the short term trips stored for a vehicle, empty if there are none."""
+    await connection.set_token("vwg")
+    response = await connection.get(
+        f"{vehicle._apibase}/fs-car/bs/tripstatistics/v1/{BRAND}/{COUNTRY}/vehicles/{vehicle.vin}/tripdata/shortTerm?type=list"
+    )
+    if isinstance(response, dict) and response.get("status_code") == 429:
+        raise SeatThrottledException("Too many requests")
+    trips = response.get("tripDataList", {}).get("tripData", []) if isinstance(response, dict) else []
+    return trips if isinstance(trips, list) else [trips]
+
+
+def _number(value):
+    """Return value as a float, 0 if it is not a number."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class SeatHistory:
+    """Hourly statistics of a vehicle, imported incrementally from its history."""
+
+    def __init__(self, hass, entry):
+        """Initialize the history, cursors are loaded on first import."""
+        self.hass = hass
+        self.vin = entry.data[CONF_VEHICLE].upper()
+        self.title = entry.title
+        self.imported = 0
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.history")
+        self._cursors = None
+
+    async def async_import(self, source, statistics, records):
+        """Import records newer than the cursor of source, return the number imported.
+
+        Records are dicts with a "timestamp", statistics a list of (key, name, unit, value function).
+        """
+        if self._cursors is None:
+            self._cursors = (await self._store.async_load() or {}).get("cursors", {})
+        cursor = self._cursors.get(source, {})
+        last = dt_util.parse_datetime(cursor["last"]) if cursor.get("last") else None
+
+        new = []
+        for record in records:
+            timestamp = dt_util.parse_datetime(str(record.get("timestamp") or ""))
+            if timestamp is None:
+                continue
+            timestamp = dt_util.as_utc(timestamp)
+            if last is None or timestamp > last:
+                new.append((timestamp, record))
+        if not new:
+            return 0
+        new.sort(key=lambda item: item[0])
+
+        # Sum the records of every hour
+        hours = {}
+        for timestamp, record in new:
+            bucket = hours.setdefault(
+                timestamp.replace(minute=0, second=0, microsecond=0),
+                {key: 0.0 for key, *_ in statistics},
+            )
+            for key, _, _, value in statistics:
+                bucket[key] += _number(value(record))
+
+        # Continue the sums of the previous import, its last hour is updated if it has new records
+        hour = dt_util.parse_datetime(cursor["hour"]) if cursor.get("hour") else None
+        states = dict(cursor.get("states", {}))
+        sums = dict(cursor.get("sums", {}))
+        rows = {key: [] for key, *_ in statistics}
+        for start in sorted(hours):
+            for key, *_ in statistics:
+                state = (states.get(key, 0.0) if start == hour else 0.0) + hours[start][key]
+                sums[key] = sums.get(key, 0.0) + hours[start][key]
+                states[key] = state
+                rows[key].append({"start": start, "state": state, "sum": sums[key]})
+            hour = start
+
+        for key, name, unit, _ in statistics:
+            metadata = {
+                "has_mean": False,
+                "has_sum": True,
+                "name": f"{self.title} {name}",
+                "source": DOMAIN,
+                "statistic_id": f"{DOMAIN}:{self.vin.lower()}_{key}",
+                "unit_of_measurement": unit,
+            }
+            for index in range(0, len(rows[key]), HISTORY_BATCH_SIZE):
+                async_add_external_statistics(self.hass, metadata, rows[key][index:index + HISTORY_BATCH_SIZE])
+
+        self._cursors[source] = {
+            "last": new[-1][0].isoformat(),
+            "hour": hour.isoformat(),
+            "states": states,
+            "sums": sums,
+        }
+        await self._store.async_save({"cursors": self._cursors})
+        self.imported += len(new)
+        _LOGGER.debug(f"Imported {len(new)} {source} records of {self.vin} into statistics")
+        return len(new)
+
+    async def async_remove(self):
+        """Remove the cursors, imported statistics are kept."""
+        await self._store.async_remove()
@@ -4,9 +4,8 @@ Support for Seat Connect Platform
 import logging
 
 from homeassistant.components.lock import LockEntity
-from homeassistant.const import CONF_RESOURCES
 
-from . import DATA, DATA_KEY, DOMAIN, SeatEntity
+from . import DATA_KEY, SeatEntity, async_add_platform_entities
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,23 +19,7 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
 
 
 async def async_setup_entry(hass, entry, async_add_devices):
-    data = hass.data[DOMAIN][entry.entry_id][DATA]
-    coordinator = data.coordinator
-    if coordinator.data is not None:
-        if CONF_RESOURCES in entry.options:
-            resources = entry.options[CONF_RESOURCES]
-        else:
-            resources = entry.data[CONF_RESOURCES]
-
-        async_add_devices(
-            SeatLock(data, instrument.vehicle_name, instrument.component, instrument.attr)
-            for instrument in (
-                instrument
-                for instrument in data.instruments
-                if instrument.component == "lock" and instrument.attr in resources
-            )
-        )
-
+    async_add_platform_entities(hass, entry, async_add_devices, "lock", SeatLock)
     return True
 
 
@@ -50,8 +33,8 @@ class SeatLock(SeatEntity, LockEntity):
 
     async def async_lock(self, **kwargs):
         """Lock the car."""
-        await self.instrument.lock()
+        await self.async_command(self.attribute, self.instrument.lock, done=lambda: self.is_locked is True)
 
     async def async_unlock(self, **kwargs):
         """Unlock the car."""
-        await self.instrument.unlock()
+        await self.async_command(self.attribute, self.instrument.unlock, done=lambda: self.is_locked is False)
@@ -0,0 +1,76 @@
+"""
+Adaptive poll scheduling for Seat Connect
+"""
+import logging
+from datetime import timedelta
+from time import monotonic
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    BOOST_DURATION,
+    NIGHT_END,
+    NIGHT_SCAN_INTERVAL,
+    NIGHT_START,
+    RELAXED_SCAN_INTERVAL,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Vehicle states that require tight polling while active
+ACTIVE_STATES = [
+    "charging",
+    "electric_climatisation",
+    "auxiliary_climatisation",
+    "pheater_heating",
+    "pheater_ventilation",
+    "window_heater",
+    "vehicle_moving",
+]
+
+
+def _vehicle_state(vehicle, attr):
+    """Return state attr for vehicle if supported, else None."""
+    try:
+        if getattr(vehicle, f"is_{attr}_supported", False):
+            return getattr(vehicle, attr)
+    except Exception as error:
+        _LOGGER.debug(f"Could not read {attr} for scheduling: {error}")
+    return None
+
+
+class SeatPollScheduler:
+    """Derive the next poll interval from vehicle state."""
+
+    def __init__(self):
+        """Initialize the scheduler."""
+        self._boost_until = 0
+
+    @property
+    def boosted(self):
+        """Return true while fast polling is forced."""
+        return monotonic() < self._boost_until
+
+    def boost(self, duration=BOOST_DURATION):
+        """Force fast polling, used after commands and state changes."""
+        self._boost_until = monotonic() + duration
+
+    def interval(self, vehicle, base: timedelta) -> timedelta:
+        """Return poll interval for a single vehicle."""
+        if self.boosted:
+            return base
+        if any(_vehicle_state(vehicle, attr) for attr in ACTIVE_STATES):
+            return base
+
+        hour = dt_util.now().hour
+        if NIGHT_START <= hour < NIGHT_END:
+            return max(base, timedelta(seconds=NIGHT_SCAN_INTERVAL))
+        if _vehicle_state(vehicle, "door_locked"):
+            return max(base, timedelta(seconds=RELAXED_SCAN_INTERVAL))
+        return base
+
+    def next_interval(self, vehicles, base: timedelta) -> timedelta:
+        """Return poll interval satisfying the most demanding vehicle."""
+        if not vehicles:
+            return base
+        return min(self.interval(vehicle, base) for vehicle in vehicles)
@@ -2,14 +2,74 @@
 Support for Seat Connect Platform
 """
 import logging
+from time import monotonic
 
-from . import DATA_KEY, DOMAIN, SeatEntity
-from .const import DATA
+from . import DATA_KEY, DOMAIN, SeatEntity, async_add_platform_entities, parse_deadbands
+from .const import (
+    DATA,
+    CONF_VEHICLE,
+    CONF_SENSOR_DEADBANDS,
+    CONF_REPUBLISH_INTERVAL,
+    DEFAULT_SENSOR_DEADBANDS,
+    DEFAULT_REPUBLISH_INTERVAL,
+)
 from homeassistant.components.sensor import DEVICE_CLASSES, SensorEntity
-from homeassistant.const import CONF_RESOURCES
+from homeassistant.core import callback
+from homeassistant.helpers import entity_registry
+from homeassistant.helpers.entity import EntityCategory
 
 _LOGGER = logging.getLogger(__name__)
 
+# Integration diagnostics: key, name, unit, icon, state and attribute functions of the coordinator
+# Created once per account, attributes only hold settings, per refresh numbers are in the diagnostics download
+DIAGNOSTIC_SENSORS = [
+    (
+        "request_budget",
+        "Request budget",
+        "requests",
+        "mdi:api",
+        lambda coordinator: int(coordinator.budget.tokens),
+        lambda coordinator: {
+            "capacity": coordinator.budget.capacity,
+            "requests_per_day": coordinator.budget.per_day,
+        },
+    ),
+    (
+        "throttle_backoff",
+        "Throttle backoff",
+        "s",
+        "mdi:timer-sand",
+        lambda coordinator: int(coordinator.budget.backoff),
+        lambda coordinator: {
+            "throttle_count": coordinator.budget.throttle_count,
+        },
+    ),
+    (
+        "refresh_latency",
+        "Refresh latency",
+        "ms",
+        "mdi:timer-outline",
+        lambda coordinator: coordinator.stats.latency_last,
+        lambda coordinator: {},
+    ),
+    (
+        "api_calls_per_refresh",
+        "API calls per refresh",
+        "requests",
+        "mdi:api",
+        lambda coordinator: coordinator.stats.api_calls_last,
+        lambda coordinator: {},
+    ),
+    (
+        "entities_written_per_refresh",
+        "Entities written per refresh",
+        "entities",
+        "mdi:pencil",
+        lambda coordinator: coordinator.stats.entities_written_last,
+        lambda coordinator: {},
+    ),
+]
+
 
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     """Set up the Seat sensors."""
@@ -20,22 +80,20 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
 
 async def async_setup_entry(hass, entry, async_add_devices):
     data = hass.data[DOMAIN][entry.entry_id][DATA]
-    coordinator = data.coordinator
-    if coordinator.data is not None:
-        if CONF_RESOURCES in entry.options:
-            resources = entry.options[CONF_RESOURCES]
-        else:
-            resources = entry.data[CONF_RESOURCES]
-
+    async_add_platform_entities(hass, entry, async_add_devices, "sensor", SeatSensor)
+    vin = entry.data[CONF_VEHICLE].upper()
+    if next(iter(data.coordinator.entries), None) != vin:
+        # Diagnostics of the account are shown on its first vehicle, remove those created per vehicle before
+        registry = entity_registry.async_get(hass)
+        for description in DIAGNOSTIC_SENSORS:
+            entity_id = registry.async_get_entity_id("sensor", DOMAIN, f"{vin}-diagnostic-{description[0]}")
+            if entity_id is not None:
+                registry.async_remove(entity_id)
+    elif data.coordinator.data is not None:
+        vehicle = data.coordinator.async_vehicle(vin)
         async_add_devices(
-            SeatSensor(
-                data, instrument.vehicle_name, instrument.component, instrument.attr
-            )
-            for instrument in (
-                instrument
-                for instrument in data.instruments
-                if instrument.component == "sensor" and instrument.attr in resources
-            )
+            SeatDiagnosticSensor(data, vehicle, *description)
+            for description in DIAGNOSTIC_SENSORS
         )
 
     return True
@@ -44,6 +102,55 @@ async def async_setup_entry(hass, entry, async_add_devices):
 class SeatSensor(SeatEntity):
     """Representation of a Seat Sensor."""
 
+    def __init__(self, *args, **kwargs):
+        """Initialize the sensor."""
+        super().__init__(*args, **kwargs)
+        self._written = None
+        self._written_at = None
+
+    @property
+    def _deadband(self):
+        """Return (value, relative) of the deadband of the instrument, None if it has none."""
+        try:
+            deadbands = parse_deadbands(self.data.options.get(CONF_SENSOR_DEADBANDS, DEFAULT_SENSOR_DEADBANDS))
+        except ValueError:
+            deadbands = parse_deadbands(DEFAULT_SENSOR_DEADBANDS)
+        return deadbands.get(self.attribute)
+
+    def _significant(self):
+        """Return true if the state differs from the published state by more than noise."""
+        deadband = self._deadband
+        if deadband is None or self._written is None:
+            return True
+        state, unit, attributes, available = self._written
+        if (unit, attributes, available) != (self.unit_of_measurement, self.extra_state_attributes, self.available):
+            return True
+        interval = self.data.options.get(CONF_REPUBLISH_INTERVAL, DEFAULT_REPUBLISH_INTERVAL)
+        if monotonic() - self._written_at >= interval:
+            return True
+        try:
+            delta = abs(float(self.state) - float(state))
+        except (TypeError, ValueError):
+            return self.state != state
+        value, relative = deadband
+        threshold = abs(float(state)) * value / 100 if relative else value
+        return delta >= threshold
+
+    @callback
+    def _async_instrument_changed(self):
+        """Write the state unless the value only moved within the deadband."""
+        if not self._significant():
+            _LOGGER.debug(f"Change of {self.attribute} of {self.vin} is within the deadband, not published")
+            return
+        self.async_write_ha_state()
+
+    @callback
+    def async_write_ha_state(self):
+        """Write the state, remembering what was published."""
+        super().async_write_ha_state()
+        self._written = (self.state, self.unit_of_measurement, self.extra_state_attributes, self.available)
+        self._written_at = monotonic()
+
     @property
     def state(self):
         """Return the state of the sensor."""
@@ -72,3 +179,52 @@ class SeatSensor(SeatEntity):
             state_class = "measurement"
         return state_class
 
+
+
+class SeatDiagnosticSensor(SensorEntity):
+    """Representation of a Seat Connect account diagnostic sensor, written when its state changes."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_should_poll = False
+
+    def __init__(self, data, vehicle, key, name, unit, icon, value, attributes):
+        """Initialize the sensor."""
+        self.data = data
+        self.vin = vehicle.vin
+        self.coordinator = data.coordinator
+        self._value = value
+        self._attributes = attributes
+        self._attr_name = f"Seat Connect {name}"
+        self._attr_native_unit_of_measurement = unit
+        self._attr_icon = icon
+        self._attr_unique_id = f"{self.vin}-diagnostic-{key}"
+        self._attr_device_info = {"identifiers": {(DOMAIN, self.vin)}}
+        self._written = None
+
+    async def async_added_to_hass(self):
+        """Register update dispatcher."""
+        self.async_on_remove(
+            self.coordinator.async_add_listener(self._async_coordinator_updated)
+        )
+
+    @callback
+    def _async_coordinator_updated(self):
+        """Write the state if it changed with the refresh."""
+        if (self.native_value, self.extra_state_attributes) != self._written:
+            self.async_write_ha_state()
+
+    @callback
+    def async_write_ha_state(self):
+        """Write the state, remembering what was published."""
+        super().async_write_ha_state()
+        self._written = (self.native_value, self.extra_state_attributes)
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        return self._value(self.coordinator)
+
+    @property
+    def extra_state_attributes(self):
+        """Return extra state attributes."""
+        return self._attributes(self.coordinator)
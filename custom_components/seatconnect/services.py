@@ -0,0 +1,309 @@
+"""
+Services for Seat Connect vehicles
+"""
+import logging
+import re
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+
+from seatconnect.exceptions import SeatInvalidRequestException
+
+from .devices import async_get_device_index
+from .const import (
+    DOMAIN,
+    SERVICE_REFS,
+    SERVICE_SET_SCHEDULE,
+    SERVICE_SET_MAX_CURRENT,
+    SERVICE_SET_CHARGE_LIMIT,
+    SERVICE_SET_CLIMATER,
+    SERVICE_SET_PHEATER_DURATION,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_SET_SCHEDULE_SCHEMA = vol.Schema(
+    {
+        vol.Required("device_id"): vol.All(cv.string, vol.Length(min=32, max=32)),
+        vol.Required("id"): vol.In([1,2,3]),
+        vol.Required("time"): cv.string,
+        vol.Required("enabled"): cv.boolean,
+        vol.Required("recurring"): cv.boolean,
+        vol.Optional("date"): cv.string,
+        vol.Optional("days"): cv.string,
+        vol.Optional("temp"): vol.All(vol.Coerce(int), vol.Range(min=16, max=30)),
+        vol.Optional("climatisation"): cv.boolean,
+        vol.Optional("charging"): cv.boolean,
+        vol.Optional("charge_current"): vol.Any(
+            vol.Range(min=1, max=254),
+            vol.In(['Maximum', 'maximum', 'Max', 'max', 'Minimum', 'minimum', 'Min', 'min', 'Reduced', 'reduced'])
+        ),
+        vol.Optional("charge_target"): vol.In([0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100]),
+        vol.Optional("off_peak_active"): cv.boolean,
+        vol.Optional("off_peak_start"): cv.string,
+        vol.Optional("off_peak_end"): cv.string,
+    }
+)
+SERVICE_SET_MAX_CURRENT_SCHEMA = vol.Schema(
+    {
+        vol.Required("device_id"): vol.All(cv.string, vol.Length(min=32, max=32)),
+        vol.Required("current"): vol.Any(
+            vol.Range(min=1, max=255),
+            vol.In(['Maximum', 'maximum', 'Max', 'max', 'Minimum', 'minimum', 'Min', 'min', 'Reduced', 'reduced'])
+        ),
+    }
+)
+SERVICE_SET_CHARGE_LIMIT_SCHEMA = vol.Schema(
+    {
+        vol.Required("device_id"): vol.All(cv.string, vol.Length(min=32, max=32)),
+        vol.Required("limit"): vol.In([0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100]),
+    }
+)
+SERVICE_SET_CLIMATER_SCHEMA = vol.Schema(
+    {
+        vol.Required("device_id"): vol.All(cv.string, vol.Length(min=32, max=32)),
+        vol.Required("enabled", default=True): cv.boolean,
+        vol.Optional("temp"): vol.All(vol.Coerce(int), vol.Range(min=16, max=30)),
+        vol.Optional("battery_power"): cv.boolean,
+        vol.Optional("aux_heater"): cv.boolean,
+        vol.Optional("spin"): vol.All(cv.string, vol.Match(r"^[0-9]{4}$"))
+    }
+)
+SERVICE_SET_PHEATER_DURATION_SCHEMA = vol.Schema(
+    {
+        vol.Required("device_id"): vol.All(cv.string, vol.Length(min=32, max=32)),
+        vol.Required("duration"): vol.In([10, 20, 30, 40, 50, 60]),
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant):
+    """Register services once for all config entries, calls are routed by device."""
+    refs = hass.data[DOMAIN].get(SERVICE_REFS, 0)
+    hass.data[DOMAIN][SERVICE_REFS] = refs + 1
+    if refs:
+        return
+
+    # Service functions
+    async def get_car(service_call):
+        """Get VIN associated with HomeAssistant device ID."""
+        # Get vehicle VIN and the coordinator polling it, indexed by device
+        vin, dev_coordinator = async_get_device_index(hass).async_resolve(service_call.data.get("device_id"))
+
+        # Return with associated coordinator and Vehicle class object
+        return dev_coordinator, dev_coordinator.connection.vehicle(vin)
+
+    async def set_schedule(service_call=None):
+        """Set departure schedule."""
+        try:
+            # Prepare data
+            id = service_call.data.get("id", 0)
+            temp = None
+
+            # Convert datetime objects to simple strings or check that strings are correctly formatted
+            try:
+                time = service_call.data.get("time").strftime("%H:%M")
+            except:
+                if re.match('^[0-9]{2}:[0-9]{2}$', service_call.data.get('time', '')):
+                    time = service_call.data.get("time", "08:00")
+                else:
+                    raise SeatInvalidRequestException(f"Invalid time string: {service_call.data.get('time')}")
+            if service_call.data.get("off_peak_start", False):
+                try:
+                    peakstart = service_call.data.get("off_peak_start").strftime("%H:%M")
+                except:
+                    if re.match('^[0-9]{2}:[0-9]{2}$', service_call.data.get("off_peak_start", "")):
+                        time = service_call.data.get("off_peak_start", "00:00")
+                    else:
+                        raise SeatInvalidRequestException(f"Invalid value for off peak start hours: {service_call.data.get('off_peak_start')}")
+            if service_call.data.get("off_peak_end", False):
+                try:
+                    peakend = service_call.data.get("off_peak_end").strftime("%H:%M")
+                except:
+                    if re.match('^[0-9]{2}:[0-9]{2}$', service_call.data.get("off_peak_end", "")):
+                        time = service_call.data.get("off_peak_end", "00:00")
+                    else:
+                        raise SeatInvalidRequestException(f"Invalid value for off peak end hours: {service_call.data.get('off_peak_end')}")
+
+            # Convert to parseable data
+            schedule = {
+                "id": service_call.data.get("id", 1),
+                "enabled": service_call.data.get("enabled"),
+                "recurring": service_call.data.get("recurring"),
+                "date": service_call.data.get("date"),
+                "time": time,
+                "days": service_call.data.get("days", "nnnnnnn"),
+            }
+            # Set optional values
+            # Night rate
+            if service_call.data.get("climatisation", None) is not None:
+                schedule["nightRateActive"] = service_call.data.get("climatisation")
+            if service_call.data.get("off_peak_start", None) is not None:
+                schedule["nightRateTimeStart"] = service_call.data.get("off_peak_start")
+            if service_call.data.get("off_peak_end", None) is not None:
+                schedule["nightRateTimeEnd"] = service_call.data.get("off_peak_end")
+            # Climatisation and charging options
+            if service_call.data.get("climatisation", None) is not None:
+                schedule["operationClimatisation"] = service_call.data.get("climatisation")
+            if service_call.data.get("charging", None) is not None:
+                schedule["operationCharging"] = service_call.data.get("charging")
+            if service_call.data.get("charge_target", None) is not None:
+                schedule["targetChargeLevel"] = service_call.data.get("charge_target")
+            if service_call.data.get("charge_current", None) is not None:
+                schedule["chargeMaxCurrent"] = service_call.data.get("charge_current")
+            # Global optional options
+            if service_call.data.get("temp", None) is not None:
+                schedule["targetTemp"] = service_call.data.get("temp")
+
+            # Find the correct car and execute service call
+            dev_coordinator, car = await get_car(service_call)
+            _LOGGER.info(f'Set departure schedule {id} with data {schedule} for car {car.vin}')
+            # The timer is reported in the format of the API, confirmed when it changed
+            timer = getattr(car, f"departure{id}", None)
+            if await dev_coordinator.async_command(
+                car.vin, f"set_schedule_{id}", car.set_timer_schedule, id, schedule,
+                done=lambda: getattr(car, f"departure{id}", None) != timer,
+            ) is True:
+                _LOGGER.debug(f"Service call 'set_schedule' executed without error")
+            else:
+                _LOGGER.warning(f"Failed to execute service call 'set_schedule' with data '{service_call}'")
+        except (SeatInvalidRequestException) as e:
+            _LOGGER.warning(f"Service call 'set_schedule' failed {e}")
+        except Exception as e:
+            raise
+
+    async def set_charge_limit(service_call=None):
+        """Set minimum charge limit."""
+        try:
+            dev_coordinator, car = await get_car(service_call)
+
+            # Get charge limit and execute service call
+            limit = service_call.data.get("limit", 50)
+            if await dev_coordinator.async_command(
+                car.vin, "set_charge_limit", car.set_charge_limit, limit, done=lambda: car.min_charge_level == limit
+            ) is True:
+                _LOGGER.debug(f"Service call 'set_charge_limit' executed without error")
+            else:
+                _LOGGER.warning(f"Failed to execute service call 'set_charge_limit' with data '{service_call}'")
+        except (SeatInvalidRequestException) as e:
+            _LOGGER.warning(f"Service call 'set_schedule' failed {e}")
+        except Exception as e:
+            raise
+
+    async def set_current(service_call=None):
+        """Set departure schedule."""
+        try:
+            dev_coordinator, car = await get_car(service_call)
+
+            # Get charge current and execute service call
+            current = service_call.data.get('current', None)
+            # Reported as the library names the settings for maximum and reduced current
+            if isinstance(current, str):
+                expected = "Maximum" if current.lower() in ["maximum", "max"] else "Reduced"
+            else:
+                expected = current
+            if await dev_coordinator.async_command(
+                car.vin, "set_current", car.set_charger_current, current, done=lambda: car.charge_max_ampere == expected
+            ) is True:
+                _LOGGER.debug(f"Service call 'set_current' executed without error")
+            else:
+                _LOGGER.warning(f"Failed to execute service call 'set_current' with data '{service_call}'")
+        except (SeatInvalidRequestException) as e:
+            _LOGGER.warning(f"Service call 'set_schedule' failed {e}")
+        except Exception as e:
+            raise
+
+    async def set_pheater_duration(service_call=None):
+        """Set duration for parking heater."""
+        try:
+            dev_coordinator, car = await get_car(service_call)
+            car.pheater_duration = service_call.data.get("duration", car.pheater_duration)
+            _LOGGER.debug(f"Service call 'set_pheater_duration' executed without error")
+            dev_coordinator.async_update_listeners()
+        except (SeatInvalidRequestException) as e:
+            _LOGGER.warning(f"Service call 'set_schedule' failed {e}")
+        except Exception as e:
+            raise
+
+    async def set_climater(service_call=None):
+        """Start or stop climatisation with options."""
+        try:
+            dev_coordinator, car = await get_car(service_call)
+
+            if service_call.data.get('enabled'):
+                action = 'auxiliary' if service_call.data.get('aux_heater', False) else 'electric'
+                temp = service_call.data.get('temp', None)
+                hvpower = service_call.data.get('battery_power', None)
+                spin = service_call.data.get('spin', None)
+            else:
+                action = 'off'
+                temp = hvpower = spin = None
+            # Execute service call
+            if action == 'auxiliary':
+                done = lambda: car.auxiliary_climatisation is True
+            elif action == 'electric':
+                done = lambda: car.electric_climatisation is True
+            else:
+                done = lambda: not car.electric_climatisation and not car.auxiliary_climatisation
+            if await dev_coordinator.async_command(
+                car.vin, "set_climater", car.set_climatisation, action, temp, hvpower, spin, done=done
+            ) is True:
+                _LOGGER.debug(f"Service call 'set_climater' executed without error")
+            else:
+                _LOGGER.warning(f"Failed to execute service call 'set_current' with data '{service_call}'")
+        except (SeatInvalidRequestException) as e:
+            _LOGGER.warning(f"Service call 'set_schedule' failed {e}")
+        except Exception as e:
+            raise
+
+    # Register services
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_SCHEDULE,
+        set_schedule,
+        schema = SERVICE_SET_SCHEDULE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_MAX_CURRENT,
+        set_current,
+        schema = SERVICE_SET_MAX_CURRENT_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_CHARGE_LIMIT,
+        set_charge_limit,
+        schema = SERVICE_SET_CHARGE_LIMIT_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_CLIMATER,
+        set_climater,
+        schema = SERVICE_SET_CLIMATER_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_PHEATER_DURATION,
+        set_pheater_duration,
+        schema = SERVICE_SET_PHEATER_DURATION_SCHEMA
+    )
+
+
+@callback
+def async_unload_services(hass: HomeAssistant):
+    """Remove services when the last config entry using them is unloaded."""
+    refs = hass.data[DOMAIN].get(SERVICE_REFS, 0) - 1
+    if refs > 0:
+        hass.data[DOMAIN][SERVICE_REFS] = refs
+        return
+    hass.data[DOMAIN].pop(SERVICE_REFS, None)
+
+    _LOGGER.debug("Unloading services")
+    hass.services.async_remove(DOMAIN, SERVICE_SET_SCHEDULE)
+    hass.services.async_remove(DOMAIN, SERVICE_SET_MAX_CURRENT)
+    hass.services.async_remove(DOMAIN, SERVICE_SET_CHARGE_LIMIT)
+    hass.services.async_remove(DOMAIN, SERVICE_SET_CLIMATER)
+    hass.services.async_remove(DOMAIN, SERVICE_SET_PHEATER_DURATION)
@@ -0,0 +1,117 @@
+"""
+Refresh timing statistics for Seat Connect
+"""
+import math
+from collections import deque
+from contextlib import contextmanager
+from time import monotonic
+
+from .const import REFRESH_STATS_SAMPLES
+
+
+class SeatRefreshStats:
+    """Timings and counters of the latest refreshes of an account."""
+
+    def __init__(self, samples=REFRESH_STATS_SAMPLES):
+        """Initialize without samples."""
+        self.refreshes = 0
+        self._samples = deque(maxlen=samples)
+        self._current = None
+
+    def start(self):
+        """Start timing a refresh."""
+        self._current = {"started": monotonic(), "steps": {}, "api_calls": 0}
+
+    def discard(self):
+        """Stop timing a refresh that did not query the API."""
+        self._current = None
+
+    def add(self, step, seconds):
+        """Add time spent in a step of the current refresh."""
+        if self._current is not None:
+            steps = self._current["steps"]
+            steps[step] = steps.get(step, 0) + seconds
+
+    @contextmanager
+    def timed(self, step):
+        """Time a step of the current refresh."""
+        started = monotonic()
+        try:
+            yield
+        finally:
+            self.add(step, monotonic() - started)
+
+    def count_api_calls(self, calls):
+        """Set number of API calls of the current refresh."""
+        if self._current is not None:
+            self._current["api_calls"] = calls
+
+    def finish(self, entities_written):
+        """Record the current refresh, once listeners were updated."""
+        if self._current is None:
+            return
+        current, self._current = self._current, None
+        self.refreshes += 1
+        self._samples.append({
+            "duration": monotonic() - current["started"],
+            "steps": current["steps"],
+            "api_calls": current["api_calls"],
+            "entities_written": entities_written,
+        })
+
+    @property
+    def last(self):
+        """Return the latest recorded refresh, None if none was recorded."""
+        return self._samples[-1] if self._samples else None
+
+    @property
+    def latency_last(self):
+        """Return duration of the latest refresh in milliseconds."""
+        return round(self.last["duration"] * 1000) if self._samples else None
+
+    @property
+    def latency_mean(self):
+        """Return average duration of the recorded refreshes in milliseconds."""
+        if not self._samples:
+            return None
+        return round(sum(sample["duration"] for sample in self._samples) * 1000 / len(self._samples))
+
+    @property
+    def latency_p95(self):
+        """Return 95th percentile duration of the recorded refreshes in milliseconds."""
+        if not self._samples:
+            return None
+        durations = sorted(sample["duration"] for sample in self._samples)
+        return round(durations[math.ceil(len(durations) * 0.95) - 1] * 1000)
+
+    @property
+    def steps_last(self):
+        """Return milliseconds spent in each step of the latest refresh."""
+        if not self._samples:
+            return {}
+        return {step: round(seconds * 1000) for step, seconds in self.last["steps"].items()}
+
+    @property
+    def api_calls_last(self):
+        """Return number of API calls of the latest refresh."""
+        return self.last["api_calls"] if self._samples else None
+
+    @property
+    def entities_written_last(self):
+        """Return number of entities written by the latest refresh."""
+        return self.last["entities_written"] if self._samples else None
+
+    def as_dict(self):
+        """Return statistics for diagnostics."""
+        return {
+            "refreshes": self.refreshes,
+            "samples": len(self._samples),
+            "latency_ms": {
+                "last": self.latency_last,
+                "mean": self.latency_mean,
+                "p95": self.latency_p95,
+            },
+            "steps_ms_last": self.steps_last,
+            "api_calls_last": self.api_calls_last,
+            "entities_written_last": self.entities_written_last,
+        }
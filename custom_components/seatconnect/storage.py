@@ -0,0 +1,217 @@
+"""
+Persistent storage for Seat Connect
+"""
+import hashlib
+import logging
+from datetime import date, datetime
+
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, SNAPSHOT_SAVE_DELAY, STORAGE_VERSION, TOKEN_SAVE_DELAY
+
+_LOGGER = logging.getLogger(__name__)
+
+# Properties entities read from vehicles and instruments, kept in the snapshot when available
+VEHICLE_PROPERTIES = [
+    "nickname",
+    "model",
+    "model_year",
+    "model_image_small",
+    "model_image_large",
+    "charging",
+]
+INSTRUMENT_PROPERTIES = [
+    "name",
+    "icon",
+    "slug_attr",
+    "state",
+    "attributes",
+    "unit",
+    "device_class",
+    "is_on",
+    "is_locked",
+    "hvac_mode",
+    "target_temperature",
+    "assumed_state",
+]
+
+
+def _serializable(value):
+    """Return value in a form that can be stored as JSON."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return {str(key): _serializable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [_serializable(item) for item in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def _read(obj, name):
+    """Return a property of a library object, None if not supported."""
+    try:
+        if getattr(obj, f"is_{name}_supported", True) is False:
+            return None
+        return getattr(obj, name, None)
+    except Exception as error:
+        _LOGGER.debug(f"Could not read {name} for snapshot: {error}")
+        return None
+
+
+class StoredVehicle:
+    """Last known vehicle information, stands in for the vehicle until it is updated."""
+
+    def __init__(self, vin, values):
+        """Initialize the vehicle."""
+        self.vin = vin
+        self._values = values
+
+    def __getattr__(self, name):
+        """Return stored value, is_<name>_supported if a value is stored."""
+        if name.startswith("is_") and name.endswith("_supported"):
+            return self._values.get(name[3:-10]) is not None
+        return self._values.get(name)
+
+
+class StoredInstrument:
+    """Last known instrument state, stands in for the instrument until it is updated."""
+
+    def __init__(self, vehicle, component, attr, values, fetched):
+        """Initialize the instrument."""
+        self.vehicle = vehicle
+        self.component = component
+        self.attr = attr
+        self.fetched = fetched
+        self.callback = None
+        self._values = values
+
+    def __getattr__(self, name):
+        """Return stored value of the instrument."""
+        return self._values.get(name)
+
+    @property
+    def vehicle_name(self):
+        return self.vehicle.vin
+
+    @property
+    def attributes(self):
+        """Return stored attributes, marked with the time the data was fetched."""
+        return dict(self._values.get("attributes") or {}, restored_from_snapshot=True, snapshot_time=self.fetched)
+
+    async def _not_available(self, *args, **kwargs):
+        raise HomeAssistantError(f"{self.attr} is not available until Seat Connect is updated")
+
+    turn_on = turn_off = lock = unlock = set_hvac_mode = set_temperature = _not_available
+
+
+class SeatSnapshotStore:
+    """Last known state of the vehicle of a config entry."""
+
+    def __init__(self, hass, entry):
+        """Initialize the store."""
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.snapshot")
+
+    async def async_load(self):
+        """Return stored instruments, empty if nothing is stored."""
+        try:
+            snapshot = await self._store.async_load()
+            if not snapshot:
+                return []
+            vehicle = StoredVehicle(snapshot["vin"], snapshot.get("vehicle", {}))
+            return [
+                StoredInstrument(
+                    vehicle,
+                    values.pop("component"),
+                    values.pop("attr"),
+                    values,
+                    # Snapshots saved before the fetch time was stored only have the save time
+                    snapshot.get("fetched", snapshot.get("saved")),
+                )
+                for values in snapshot.get("instruments", [])
+            ]
+        except Exception as error:
+            _LOGGER.warning(f"Could not load stored state of Seat Connect vehicle: {error}")
+            return []
+
+    def async_delay_save(self, vehicle, instruments, fetched=None):
+        """Save state of the vehicle and its instruments fetched at that time, at most once per delay."""
+        self._store.async_delay_save(
+            lambda: self._snapshot(vehicle, instruments, fetched), SNAPSHOT_SAVE_DELAY
+        )
+
+    async def async_remove(self):
+        """Remove the stored state."""
+        await self._store.async_remove()
+
+    @staticmethod
+    def _snapshot(vehicle, instruments, fetched):
+        """Return storable state, read when the save is due."""
+        saved = dt_util.utcnow()
+        return {
+            "vin": vehicle.vin,
+            "saved": saved.isoformat(),
+            "fetched": (fetched or saved).isoformat(),
+            "vehicle": {
+                name: _serializable(_read(vehicle, name)) for name in VEHICLE_PROPERTIES
+            },
+            "instruments": [
+                dict(
+                    {
+                        name: _serializable(_read(instrument, name))
+                        for name in INSTRUMENT_PROPERTIES
+                    },
+                    component=instrument.component,
+                    attr=instrument.attr,
+                )
+                for instrument in instruments
+            ],
+        }
+
+
+class SeatTokenStore:
+    """Tokens of a Seat Connect account, reused instead of logging in."""
+
+    def __init__(self, hass, username):
+        """Initialize the store, keyed without revealing the username."""
+        key = hashlib.sha256(username.lower().encode()).hexdigest()[:16]
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{key}.tokens")
+        self._saved = None
+
+    @staticmethod
+    def _copy(tokens):
+        """Return a copy of the tokens of all clients."""
+        return {client: dict(values or {}) for client, values in (tokens or {}).items()}
+
+    async def async_load(self):
+        """Return stored tokens, None if nothing is stored."""
+        try:
+            data = await self._store.async_load()
+        except Exception as error:
+            _LOGGER.warning(f"Could not load stored Seat Connect tokens: {error}")
+            return None
+        if not data or not data.get("tokens"):
+            return None
+        self._saved = self._copy(data["tokens"])
+        return self._copy(data["tokens"])
+
+    def async_delay_save(self, tokens):
+        """Save tokens if they changed since last saved."""
+        tokens = self._copy(tokens)
+        if not tokens or tokens == self._saved:
+            return
+        self._saved = tokens
+        self._store.async_delay_save(lambda: {"tokens": tokens}, TOKEN_SAVE_DELAY)
+
+    async def async_save(self, tokens):
+        """Save tokens right away."""
+        self._saved = self._copy(tokens)
+        await self._store.async_save({"tokens": self._saved})
+
+    async def async_remove(self):
+        """Remove stored tokens."""
+        self._saved = None
+        await self._store.async_remove()
@@ -7,9 +7,8 @@ import voluptuous as vol
 
 from homeassistant.helpers.entity import ToggleEntity
 from homeassistant.helpers import config_validation as cv, entity_platform, service
-from homeassistant.const import CONF_RESOURCES
 
-from . import DATA, DATA_KEY, DOMAIN, SeatEntity, UPDATE_CALLBACK
+from . import DATA_KEY, DOMAIN, SeatEntity, UPDATE_CALLBACK, async_add_platform_entities
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,25 +21,9 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
 
 
 async def async_setup_entry(hass, entry, async_add_devices):
-    data = hass.data[DOMAIN][entry.entry_id][DATA]
-    coordinator = data.coordinator
-    if coordinator.data is not None:
-        if CONF_RESOURCES in entry.options:
-            resources = entry.options[CONF_RESOURCES]
-        else:
-            resources = entry.data[CONF_RESOURCES]
-
-        async_add_devices(
-            SeatSwitch(
-                data, instrument.vehicle_name, instrument.component, instrument.attr, hass.data[DOMAIN][entry.entry_id][UPDATE_CALLBACK]
-            )
-            for instrument in (
-                instrument
-                for instrument in data.instruments
-                if instrument.component == "switch" and instrument.attr in resources
-            )
-        )
-
+    async_add_platform_entities(
+        hass, entry, async_add_devices, "switch", SeatSwitch, hass.data[DOMAIN][entry.entry_id][UPDATE_CALLBACK]
+    )
     return True
 
 
@@ -54,12 +37,12 @@ class SeatSwitch(SeatEntity, ToggleEntity):
 
     async def async_turn_on(self, **kwargs):
         """Turn the switch on."""
-        await self.instrument.turn_on()
+        await self.async_command(self.attribute, self.instrument.turn_on, done=lambda: bool(self.is_on))
         self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs):
         """Turn the switch off."""
-        await self.instrument.turn_off()
+        await self.async_command(self.attribute, self.instrument.turn_off, done=lambda: not self.is_on)
         self.async_write_ha_state()
 
     @property
@@ -0,0 +1,87 @@
+"""
+Request budget for Seat Connect API calls
+"""
+import logging
+import random
+from time import monotonic
+
+from .const import (
+    BACKOFF_BASE,
+    BACKOFF_MAX,
+    DEFAULT_REQUEST_BUDGET,
+    REQUEST_BUDGET_BURST,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SeatRequestBudget:
+    """Token bucket for API calls of an account, with backoff when throttled."""
+
+    def __init__(self, per_day=DEFAULT_REQUEST_BUDGET):
+        """Initialize a full bucket."""
+        self.deferred = 0
+        self.throttle_count = 0
+        self._refilled = monotonic()
+        self._backoff_until = 0
+        self._tokens = None
+        self.configure(per_day)
+
+    def configure(self, per_day):
+        """Set the daily budget, calls already available are kept up to the new capacity."""
+        if self._tokens is not None:
+            self._refill()
+        self.per_day = per_day
+        self.capacity = int(per_day * REQUEST_BUDGET_BURST)
+        self._rate = per_day / 86400
+        self._tokens = self.capacity if self._tokens is None else min(self._tokens, self.capacity)
+
+    def _refill(self):
+        """Add tokens for the time passed since last refill."""
+        now = monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._refilled) * self._rate)
+        self._refilled = now
+
+    @property
+    def tokens(self):
+        """Return number of API calls currently available."""
+        self._refill()
+        return self._tokens
+
+    def can_afford(self, cost):
+        """Return true if cost API calls fit in the budget."""
+        return self.tokens >= cost
+
+    def time_until(self, cost):
+        """Return seconds until cost API calls fit in the budget."""
+        missing = min(cost, self.capacity) - self.tokens
+        return max(0, missing / self._rate)
+
+    def interval(self, cost):
+        """Return the shortest average seconds between updates of cost API calls the budget sustains."""
+        return cost / self._rate
+
+    def consume(self, cost):
+        """Withdraw API calls made from the budget."""
+        self._refill()
+        self._tokens = max(0, self._tokens - cost)
+
+    @property
+    def backoff(self):
+        """Return seconds left of the current backoff, 0 if not backing off."""
+        return max(0, self._backoff_until - monotonic())
+
+    def throttled(self):
+        """Register a throttle response, return seconds to back off."""
+        self.throttle_count += 1
+        delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (self.throttle_count - 1))
+        # Jitter to avoid hitting the API in lockstep with other clients
+        delay = random.uniform(delay / 2, delay)
+        self._backoff_until = monotonic() + delay
+        _LOGGER.warning(f"Throttled by Seat Connect, backing off for {delay:.0f} seconds")
+        return delay
+
+    def succeeded(self):
+        """Register a successful update, resets the backoff."""
+        self.throttle_count = 0
+        self._backoff_until = 0
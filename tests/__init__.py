@@ -0,0 +1 @@
+"""Tests for the Seat Connect integration."""
@@ -0,0 +1,200 @@
+"""
+Fixtures and stand-ins for the seatconnect library
+
+Requires Home Assistant and pytest-homeassistant-custom-component, run from
+the repository root:
+
+    python -m pytest
+"""
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.seatconnect.const import DOMAIN
+
+pytest_plugins = "pytest_homeassistant_custom_component"
+
+RESOURCES = ["battery_level", "door_locked"]
+
+
+class FakeInstrument:
+    """Instrument reading its state from the values of a fake vehicle."""
+
+    def __init__(self, vehicle, component, attr, name, unit=None, device_class=None):
+        self.vehicle = vehicle
+        self.component = component
+        self.attr = attr
+        self.slug_attr = attr
+        self.name = name
+        self.unit = unit
+        self.device_class = device_class
+        self.icon = "mdi:car"
+        self.callback = None
+        self.assumed_state = False
+        self.attributes = {}
+
+    @property
+    def vehicle_name(self):
+        return self.vehicle.vin
+
+    @property
+    def state(self):
+        return self.vehicle.values[self.attr]
+
+    @property
+    def is_locked(self):
+        return self.state
+
+    async def lock(self):
+        # The library updates the vehicle once the car confirmed the request
+        self.vehicle.values[self.attr] = True
+        await self.vehicle.update()
+
+    async def unlock(self):
+        self.vehicle.values[self.attr] = False
+        await self.vehicle.update()
+
+
+class FakeDashboard:
+    """Dashboard with a sensor and a lock."""
+
+    def __init__(self, vehicle, **config):
+        self.config = config
+        self.instruments = [
+            FakeInstrument(vehicle, "sensor", "battery_level", "Battery level", "%", "battery"),
+            FakeInstrument(vehicle, "lock", "door_locked", "Door locked"),
+        ]
+
+
+class FakeVehicle:
+    """Vehicle of the fake connection, updates raise while fail is set."""
+
+    def __init__(self, vin):
+        self.vin = vin
+        self.unique_id = vin
+        self.model = "Leon"
+        self.model_year = "2021"
+        self.nickname = None
+        self.is_nickname_supported = False
+        self.is_model_image_small_supported = False
+        self.is_model_image_large_supported = False
+        self.deactivated = False
+        self.requests_remaining = -1
+        self.attrs = {}
+        self._services = {}
+        # Discovered on every update, like a vehicle discovered over an hour ago
+        self._discovered = None
+        self._dashboard = None
+        self.values = {"battery_level": 80, "door_locked": True, "min_charge_level": 0}
+        self.charging = 0
+        self.fail = False
+        self.updates = 0
+        self.fetched = []
+        # Settings the car reports after the given number of fetches of their section
+        self.reported_after = {}
+
+    async def discover(self):
+        if self.fail:
+            raise Exception("Service unavailable")
+
+    async def update(self):
+        await self.discover()
+        self.updates += 1
+        return True
+
+    async def get_statusreport(self):
+        self.fetched.append("status")
+
+    async def get_charger(self):
+        self.fetched.append("charger")
+
+    async def get_timerprogramming(self):
+        self.fetched.append("timers")
+        for key, (value, fetches) in list(self.reported_after.items()):
+            if fetches <= 1:
+                self.values[key] = value
+                del self.reported_after[key]
+            else:
+                self.reported_after[key] = (value, fetches - 1)
+
+    @property
+    def min_charge_level(self):
+        return self.values["min_charge_level"]
+
+    async def set_charge_limit(self, limit):
+        self.reported_after["min_charge_level"] = (limit, 2)
+        return True
+
+    def dashboard(self, **config):
+        if self._dashboard is None or self._dashboard.config != config:
+            self._dashboard = FakeDashboard(self, **config)
+        return self._dashboard
+
+
+class FakeConnection:
+    """Connection to an account, vehicles are shared by all connections."""
+
+    vehicles = {}
+
+    def __init__(self, session, username, password, fulldebug=False, **optional):
+        self._session_auth_username = username
+        self._session_auth_password = password
+        self._session_fulldebug = fulldebug
+        self._session_tokens = {}
+
+    async def doLogin(self):
+        self._session_tokens = {"seat": {"access_token": "a", "refresh_token": "r"}}
+        return True
+
+    async def get_vehicles(self):
+        return list(self.vehicles.values())
+
+    async def get(self, url, vin=""):
+        return {}
+
+    async def refresh_token(self, client):
+        return True
+
+    async def set_token(self, client):
+        return True
+
+    async def terminate(self):
+        pass
+
+    def vehicle(self, vin):
+        return self.vehicles.get(vin.upper())
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Load the integration from this repository."""
+    yield
+
+
+@pytest.fixture
+def vehicles():
+    """Patch the library connection, return its vehicles by VIN."""
+    FakeConnection.vehicles = {}
+    with patch("custom_components.seatconnect.Connection", FakeConnection):
+        yield FakeConnection.vehicles
+
+
+def create_entry(hass, vehicles, vin, **options):
+    """Add a vehicle to the account and return its config entry, options override the defaults."""
+    vehicles[vin] = FakeVehicle(vin)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        unique_id=vin,
+        title=vin,
+        data={
+            "username": "user@example.com",
+            "password": "password",
+            "vehicle": vin,
+            "instruments": {resource: resource for resource in RESOURCES},
+        },
+        options={"convert": "no_conversion", "mutable": True, "spin": None, "resources": RESOURCES, **options},
+    )
+    entry.add_to_hass(hass)
+    return entry
@@ -0,0 +1,72 @@
+"""Tests for the command queue."""
+import asyncio
+
+import pytest
+from seatconnect.exceptions import SeatRequestInProgressException
+
+from custom_components.seatconnect.commands import SeatCommandQueue
+
+VIN = "VIN00000000000001"
+
+
+async def test_superseded_requests_share_result_and_done(hass):
+    """Queued requests for a setting are replaced by the latest, which is followed up on once."""
+    completed = []
+    queue = SeatCommandQueue(hass, VIN, lambda vin, command, result: completed.append((vin, command, result)))
+    calls = []
+    running = asyncio.Event()
+
+    async def action(name):
+        calls.append(name)
+        if name == "climatisation":
+            await running.wait()
+        return name
+
+    def locked():
+        return True
+
+    def unlocked():
+        return False
+
+    first = hass.async_create_task(queue.async_submit("climatisation", action, "climatisation"))
+    await asyncio.sleep(0)
+    lock = hass.async_create_task(queue.async_submit("door_locked", action, "lock", done=locked))
+    unlock = hass.async_create_task(queue.async_submit("door_locked", action, "unlock", done=unlocked))
+    await asyncio.sleep(0)
+    assert queue.in_flight is not None and queue.pending == 1
+
+    running.set()
+    assert await first == "climatisation"
+    assert await lock == "unlock"
+    assert await unlock == "unlock"
+    assert calls == ["climatisation", "unlock"]
+    assert queue.coalesced == 1
+    # Callers of the replaced request share the predicate of the request that was run
+    assert [(vin, command.key, command.done, result) for vin, command, result in completed] == [
+        (VIN, "climatisation", None, "climatisation"),
+        (VIN, "door_locked", unlocked, "unlock"),
+    ]
+
+
+async def test_retry_while_busy(hass, monkeypatch):
+    """A request is retried while the car is busy, other errors reach the caller without completion."""
+    monkeypatch.setattr("custom_components.seatconnect.commands.COMMAND_RETRY_DELAY", 0)
+    completed = []
+    queue = SeatCommandQueue(hass, VIN, lambda vin, command, result: completed.append(command.key))
+    attempts = 0
+
+    async def busy():
+        nonlocal attempts
+        attempts += 1
+        if attempts < 3:
+            raise SeatRequestInProgressException("Request in progress")
+        return True
+
+    async def failing():
+        raise ValueError("Invalid request")
+
+    assert await queue.async_submit("busy", busy) is True
+    assert attempts == 3
+    with pytest.raises(ValueError):
+        await queue.async_submit("failing", failing)
+    assert completed == ["busy"]
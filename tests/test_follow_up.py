@@ -0,0 +1,65 @@
+"""Tests for polling the data changed by requests."""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from homeassistant.helpers import device_registry
+
+from custom_components.seatconnect.const import COORDINATORS, DOMAIN
+
+from .conftest import create_entry
+
+VIN = "VIN00000000000001"
+
+
+@pytest.fixture(autouse=True)
+def fast_follow_up():
+    """Follow up within a fraction of a second."""
+    with patch("custom_components.seatconnect.FOLLOW_UP_DELAY", 0.01), patch(
+        "custom_components.seatconnect.FOLLOW_UP_MAX_DELAY", 0.02
+    ), patch("custom_components.seatconnect.FOLLOW_UP_TIMEOUT", 0.5):
+        yield
+
+
+async def test_no_follow_up_after_library_update(hass, vehicles):
+    """Instruments update the vehicle after their request, the data is not polled again."""
+    entry = create_entry(hass, vehicles, VIN)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][COORDINATORS]["user@example.com"]
+    vehicle = vehicles[VIN]
+    vehicle.values["door_locked"] = False
+    await coordinator.async_refresh()
+    updates, vehicle.fetched = vehicle.updates, []
+
+    await hass.services.async_call("lock", "lock", {"entity_id": "lock.vin00000000000001_door_locked"}, blocking=True)
+    await hass.async_block_till_done()
+    assert hass.states.get("lock.vin00000000000001_door_locked").state == "locked"
+    assert vehicle.updates == updates + 1
+    assert not coordinator._follow_ups
+    await asyncio.sleep(0.1)
+    assert vehicle.fetched == []
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_service_follow_up_until_reported(hass, vehicles):
+    """A service request is followed up on until the car reports the requested setting."""
+    entry = create_entry(hass, vehicles, VIN)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][COORDINATORS]["user@example.com"]
+    vehicle = vehicles[VIN]
+    device = device_registry.async_get(hass).async_get_device({(DOMAIN, VIN)})
+    updates, vehicle.fetched = vehicle.updates, []
+
+    await hass.services.async_call(DOMAIN, "set_charge_limit", {"device_id": device.id, "limit": 50}, blocking=True)
+    assert coordinator._follow_ups
+    # Unrelated changes are not mistaken for the confirmation
+    vehicle.values["battery_level"] = 60
+    await asyncio.sleep(0.2)
+    await hass.async_block_till_done()
+    assert vehicle.min_charge_level == 50
+    assert vehicle.fetched == ["timers", "timers"]
+    assert vehicle.updates == updates
+    assert not coordinator._follow_ups
+    assert await hass.config_entries.async_unload(entry.entry_id)
@@ -0,0 +1,78 @@
+"""Tests for the import of trip history into long-term statistics."""
+import pytest
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.statistics import statistics_during_period
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.components.recorder.common import async_wait_recording_done
+
+from custom_components.seatconnect.const import DOMAIN
+from custom_components.seatconnect.history import TRIP_STATISTICS, SeatHistory
+
+VIN = "VIN00000000000001"
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(recorder_mock, enable_custom_integrations):
+    """Set up the recorder before Home Assistant starts."""
+    yield
+
+
+@pytest.fixture
+def entry(hass):
+    """Return the config entry of a vehicle."""
+    entry = MockConfigEntry(domain=DOMAIN, title=VIN, data={"vehicle": VIN})
+    entry.add_to_hass(hass)
+    return entry
+
+
+async def _async_statistics(hass, key):
+    """Return (state, sum) of the hourly statistics of key."""
+    await async_wait_recording_done(hass)
+    statistic_id = f"{DOMAIN}:{VIN.lower()}_{key}"
+    statistics = await get_instance(hass).async_add_executor_job(
+        statistics_during_period,
+        hass,
+        dt_util.parse_datetime("2023-01-01T00:00:00Z"),
+        None,
+        {statistic_id},
+        "hour",
+        None,
+        {"state", "sum"},
+    )
+    return [(row["state"], row["sum"]) for row in statistics.get(statistic_id, [])]
+
+
+async def test_import_same_hour(hass, entry):
+    """A later import with records in the hour last imported continues its state and sum."""
+    trips = [
+        {"timestamp": "2023-01-01T10:05:00Z", "mileage": 10, "traveltime": 12},
+        {"timestamp": "2023-01-01T10:45:00Z", "mileage": 5, "traveltime": 6},
+        {"timestamp": "2023-01-01T12:10:00Z", "mileage": 20, "traveltime": 30},
+    ]
+    assert await SeatHistory(hass, entry).async_import("trips", TRIP_STATISTICS, trips) == 3
+    assert await _async_statistics(hass, "trip_distance") == [(15.0, 15.0), (20.0, 35.0)]
+
+    # Loaded from storage, the cursor of the previous import is continued
+    trips += [
+        {"timestamp": "2023-01-01T12:50:00Z", "mileage": 1, "traveltime": 2},
+        {"timestamp": "2023-01-01T13:20:00Z", "mileage": 4, "traveltime": 8},
+    ]
+    assert await SeatHistory(hass, entry).async_import("trips", TRIP_STATISTICS, trips) == 2
+    assert await _async_statistics(hass, "trip_distance") == [(15.0, 15.0), (21.0, 36.0), (4.0, 40.0)]
+    assert await _async_statistics(hass, "trip_duration") == [(18.0, 18.0), (32.0, 50.0), (8.0, 58.0)]
+
+
+async def test_reimport_unchanged(hass, entry):
+    """Records already imported are skipped, statistics are left as they are."""
+    trips = [
+        {"timestamp": "2023-01-01T10:05:00Z", "mileage": 10, "traveltime": 12},
+        {"timestamp": "2023-01-01T11:05:00+01:00", "mileage": 5, "traveltime": 6},
+        {"timestamp": None, "mileage": 100, "traveltime": 100},
+    ]
+    history = SeatHistory(hass, entry)
+    assert await history.async_import("trips", TRIP_STATISTICS, trips) == 2
+    assert await history.async_import("trips", TRIP_STATISTICS, trips) == 0
+    assert await SeatHistory(hass, entry).async_import("trips", TRIP_STATISTICS, list(reversed(trips))) == 0
+    assert history.imported == 2
+    assert await _async_statistics(hass, "trip_distance") == [(15.0, 15.0)]
@@ -0,0 +1,112 @@
+"""Tests for the account coordinator."""
+from datetime import timedelta
+from unittest.mock import patch
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.seatconnect.const import COORDINATORS, DATA, DOMAIN
+
+from .conftest import create_entry
+
+VIN_1 = "VIN00000000000001"
+VIN_2 = "VIN00000000000002"
+
+
+async def test_restored_vehicle_kept_when_first_update_fails(hass, hass_storage, vehicles):
+    """A vehicle served from its snapshot keeps its instruments while its updates fail."""
+    entries = [create_entry(hass, vehicles, vin) for vin in (VIN_1, VIN_2)]
+    assert await hass.config_entries.async_setup(entries[0].entry_id)
+    await hass.async_block_till_done()
+    vehicles[VIN_2].values["battery_level"] = 55
+    await hass.data[DOMAIN][COORDINATORS]["user@example.com"].async_refresh()
+    # Write the delayed snapshots
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=5))
+    await hass.async_block_till_done()
+    for entry in entries:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    # Restart served from snapshots, the second vehicle fails before it was ever updated
+    for vehicle in vehicles.values():
+        vehicle.fail = True
+    vehicles[VIN_2].values["battery_level"] = 20
+    for entry in entries:
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][COORDINATORS]["user@example.com"]
+    vehicles[VIN_1].fail = False
+    vehicles[VIN_1].values["battery_level"] = 70
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert coordinator.last_update_success
+    assert coordinator.failed_vehicles == [VIN_2]
+    assert coordinator.async_vehicle(VIN_2) is not None
+    assert hass.states.get("sensor.vin00000000000001_battery_level").state == "70"
+    state = hass.states.get("sensor.vin00000000000002_battery_level")
+    assert state.state == "55"
+    assert state.attributes["restored_from_snapshot"] is True
+    assert hass.states.get("lock.vin00000000000002_door_locked").state == "locked"
+
+    # Live instruments replace the restored ones once the vehicle updates
+    vehicles[VIN_2].fail = False
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    state = hass.states.get("sensor.vin00000000000002_battery_level")
+    assert state.state == "20"
+    assert "restored_from_snapshot" not in state.attributes
+
+    for entry in entries:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_nickname_renames_entities(hass, vehicles):
+    """A nickname set in the app names the entities from their next write, the instrument being unchanged."""
+    entry = create_entry(hass, vehicles, VIN_1)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.vin00000000000001_battery_level").name == f"{VIN_1} Battery level"
+
+    vehicles[VIN_1].is_nickname_supported = True
+    vehicles[VIN_1].nickname = "Leon"
+    await hass.data[DOMAIN][COORDINATORS]["user@example.com"].async_refresh()
+    hass.data[DOMAIN][entry.entry_id][DATA].entities[("sensor", "battery_level")].async_write_ha_state()
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.vin00000000000001_battery_level").name == "Leon Battery level"
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_restored_state_available_until_vehicle_updates(hass, hass_storage, vehicles):
+    """Restored entities stay available while Seat Connect fails, marked with the time the data was fetched."""
+    entry = create_entry(hass, vehicles, VIN_1)
+    fetched = dt_util.utcnow() - timedelta(hours=3)
+    with patch("homeassistant.util.dt.utcnow", return_value=fetched):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=5))
+    await hass.async_block_till_done()
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    vehicles[VIN_1].fail = True
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][COORDINATORS]["user@example.com"]
+    assert not coordinator.last_update_success
+    state = hass.states.get("sensor.vin00000000000001_battery_level")
+    assert state.state == "80"
+    assert state.attributes["restored_from_snapshot"] is True
+    assert state.attributes["snapshot_time"] == fetched.isoformat()
+    assert hass.states.get("lock.vin00000000000001_door_locked").state == "locked"
+
+    # Once live, availability follows the updates again
+    vehicles[VIN_1].fail = False
+    await coordinator.async_refresh()
+    vehicles[VIN_1].fail = True
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.vin00000000000001_battery_level").state == "unavailable"
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
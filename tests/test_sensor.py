@@ -0,0 +1,114 @@
+"""Tests for the sensor platform."""
+from time import monotonic
+from unittest.mock import patch
+
+import pytest
+from homeassistant.helpers import entity_registry
+
+from custom_components.seatconnect import parse_deadbands
+from custom_components.seatconnect.const import COORDINATORS, DOMAIN
+from custom_components.seatconnect.sensor import DIAGNOSTIC_SENSORS
+
+from .conftest import create_entry
+
+VIN = "VIN00000000000001"
+VIN_2 = "VIN00000000000002"
+BATTERY_LEVEL = "sensor.vin00000000000001_battery_level"
+
+
+def test_parse_deadbands():
+    """Deadbands are absolute, or relative with a percent sign."""
+    assert parse_deadbands("battery_level=2, charging_power=5%;  fuel_level = 0.5 ,") == {
+        "battery_level": (2.0, False),
+        "charging_power": (5.0, True),
+        "fuel_level": (0.5, False),
+    }
+    assert parse_deadbands("") == {}
+    assert parse_deadbands(None) == {}
+
+
+@pytest.mark.parametrize("value", ["battery_level", "battery_level=x", "=2", "battery_level=-1"])
+def test_parse_deadbands_invalid(value):
+    """Items without a name or a non-negative number are rejected."""
+    with pytest.raises(ValueError):
+        parse_deadbands(value)
+
+
+async def _async_report(hass, vehicles, battery_level, now=None):
+    """Report a battery level and refresh, return the published state."""
+    vehicles[VIN].values["battery_level"] = battery_level
+    with patch("custom_components.seatconnect.sensor.monotonic", return_value=now or monotonic()):
+        await hass.data[DOMAIN][COORDINATORS]["user@example.com"].async_refresh()
+        await hass.async_block_till_done()
+    return hass.states.get(BATTERY_LEVEL).state
+
+
+async def test_absolute_deadband(hass, vehicles):
+    """Changes within an absolute deadband are not published, changes from the published value add up."""
+    entry = create_entry(hass, vehicles, VIN, sensor_deadbands="battery_level=2")
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert hass.states.get(BATTERY_LEVEL).state == "80"
+
+    assert await _async_report(hass, vehicles, 81) == "80"
+    assert await _async_report(hass, vehicles, 79) == "80"
+    assert await _async_report(hass, vehicles, 82) == "82"
+    assert await _async_report(hass, vehicles, 83) == "82"
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_relative_deadband(hass, vehicles):
+    """A relative deadband is a percentage of the published value."""
+    entry = create_entry(hass, vehicles, VIN, sensor_deadbands="battery_level=10%")
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert await _async_report(hass, vehicles, 87) == "80"
+    assert await _async_report(hass, vehicles, 88) == "88"
+    assert await _async_report(hass, vehicles, 96) == "88"
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_republish_interval(hass, vehicles):
+    """A change within the deadband is published once the published value is older than the interval."""
+    entry = create_entry(hass, vehicles, VIN, sensor_deadbands="battery_level=2", republish_interval=600)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert await _async_report(hass, vehicles, 81, monotonic() + 599) == "80"
+    assert await _async_report(hass, vehicles, 80.5, monotonic() + 601) == "80.5"
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_no_deadband(hass, vehicles):
+    """Sensors without a deadband publish every change."""
+    entry = create_entry(hass, vehicles, VIN, sensor_deadbands="fuel_level=2")
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert await _async_report(hass, vehicles, 81) == "81"
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_diagnostic_sensors_once_per_account(hass, vehicles):
+    """Diagnostic sensors are created on the first vehicle of the account and written when they change."""
+    entries = [create_entry(hass, vehicles, vin) for vin in (VIN, VIN_2)]
+    registry = entity_registry.async_get(hass)
+    # Created for every vehicle by earlier versions
+    registry.async_get_or_create("sensor", DOMAIN, f"{VIN_2}-diagnostic-throttle_backoff", config_entry=entries[1])
+    assert await hass.config_entries.async_setup(entries[0].entry_id)
+    await hass.async_block_till_done()
+
+    unique_ids = [entry.unique_id for entry in registry.entities.values() if "-diagnostic-" in entry.unique_id]
+    assert sorted(unique_ids) == sorted(f"{VIN}-diagnostic-{description[0]}" for description in DIAGNOSTIC_SENSORS)
+    entity_id = registry.async_get_entity_id("sensor", DOMAIN, f"{VIN}-diagnostic-throttle_backoff")
+    state = hass.states.get(entity_id)
+    assert state.state == "0"
+
+    await hass.data[DOMAIN][COORDINATORS]["user@example.com"].async_refresh()
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).last_updated == state.last_updated
+
+    for entry in entries:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -0,0 +1,104 @@
+"""Tests for the API request budget."""
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.seatconnect.const import BACKOFF_BASE, BACKOFF_MAX, COORDINATORS, DOMAIN
+from custom_components.seatconnect.throttle import SeatRequestBudget
+
+from .conftest import create_entry
+
+VIN = "VIN00000000000001"
+
+
+class Clock:
+    """Monotonic clock moved by the test."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Patch the clock of the budget."""
+    clock = Clock()
+    with patch("custom_components.seatconnect.throttle.monotonic", clock):
+        yield clock
+
+
+def test_refill(clock):
+    """Calls are refilled at the daily rate, up to a quarter of the daily budget."""
+    budget = SeatRequestBudget(per_day=864)
+    assert budget.capacity == 216
+    budget.consume(216)
+    assert budget.tokens == 0
+    assert not budget.can_afford(1)
+
+    clock.now += 100
+    assert budget.tokens == pytest.approx(1)
+    assert budget.can_afford(1)
+
+    clock.now += 86400
+    assert budget.tokens == 216
+
+
+def test_time_until(clock):
+    """Waiting time covers the missing calls, costs beyond the capacity wait for a full bucket."""
+    budget = SeatRequestBudget(per_day=864)
+    assert budget.time_until(14) == 0
+    budget.consume(210)
+    assert budget.time_until(14) == pytest.approx(800)
+    assert budget.time_until(1000) == pytest.approx(21000)
+    assert budget.interval(14) == pytest.approx(1400)
+
+    clock.now += 800
+    assert budget.can_afford(14)
+
+
+def test_configure_keeps_calls_up_to_capacity(clock):
+    """A changed budget keeps the calls available, capped at the new capacity."""
+    budget = SeatRequestBudget(per_day=1000)
+    budget.consume(50)
+    budget.configure(2000)
+    assert budget.capacity == 500
+    assert budget.tokens == 200
+    budget.configure(400)
+    assert budget.capacity == 100
+    assert budget.tokens == 100
+
+
+def test_backoff_with_jitter(clock):
+    """Backoff doubles with every throttle response up to the maximum, jittered down to half."""
+    budget = SeatRequestBudget()
+    with patch("custom_components.seatconnect.throttle.random.uniform", lambda low, high: low):
+        assert budget.throttled() == BACKOFF_BASE / 2
+        assert budget.backoff == BACKOFF_BASE / 2
+        assert budget.throttled() == BACKOFF_BASE
+        for _ in range(10):
+            delay = budget.throttled()
+        assert delay == BACKOFF_MAX / 2
+    with patch("custom_components.seatconnect.throttle.random.uniform", lambda low, high: high):
+        assert budget.throttled() == BACKOFF_MAX
+
+    clock.now += BACKOFF_MAX / 2
+    assert budget.backoff == BACKOFF_MAX / 2
+    budget.succeeded()
+    assert budget.backoff == 0
+    assert budget.throttle_count == 0
+
+
+async def test_budget_option(hass, vehicles):
+    """The daily budget of the account follows the options of its entries."""
+    entry = create_entry(hass, vehicles, VIN, request_budget=500)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][COORDINATORS]["user@example.com"]
+    assert coordinator.budget.per_day == 500
+
+    hass.config_entries.async_update_entry(entry, options={**entry.options, "request_budget": 2000})
+    await hass.async_block_till_done()
+    assert coordinator.budget.per_day == 2000
+    assert await hass.config_entries.async_unload(entry.entry_id)